@@ -0,0 +1,62 @@
+"""Minimal in-process ASGI caller for tests that only need status and JSON body."""
+
+import asyncio
+import json
+from typing import Any, Optional, Tuple
+
+
+async def call_json(app, method: str, path: str, json_body: Optional[Any] = None) -> Tuple[int, Any]:
+    """Send one request straight into ``app`` and return ``(status, decoded_json)``.
+
+    The HTTP scope is built by hand and the response is read back from the
+    ``send`` events, so no httpx client or transport is involved. Exceptions
+    raised by the app propagate to the caller.
+    """
+    path, _, query_string = path.partition("?")
+    body = b"" if json_body is None else json.dumps(json_body).encode()
+    headers = [(b"host", b"test")]
+    if json_body is not None:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": headers,
+        "client": ("127.0.0.1", 123),
+        "server": ("test", 80),
+    }
+
+    request_sent = False
+    response_complete = asyncio.Event()
+    status = None
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+
+    raw = b"".join(chunks)
+    return status, json.loads(raw) if raw else None
@@ -1,16 +1,22 @@
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
-from src.api.v1.admin import router as admin_router
+from src.core.errors import ContentFileNotFoundError, SecurityError
 from src.dependencies import get_content_scanner, get_fs_service, require_current_admin
 from src.schemas.content_node import ContentNode
 from src.schemas.user import User
 
+ADMIN_USER = User.model_construct(
+    user_id=UUID("22222222-2222-2222-2222-222222222222"),
+    full_name="Admin User",
+    email="admin@test.com",
+    role="admin"
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_fs_service():
     """Mock FileSystemService."""
     service = MagicMock()
@@ -20,11 +26,11 @@ def mock_fs_service():
     service.delete_file = AsyncMock()
     service.delete_directory = AsyncMock()
     service.scan_directory = AsyncMock()
-    service.path_exists = AsyncMock(return_value=False)
+    service.path_exists = AsyncMock()
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_content_scanner():
     """Mock ContentScannerService."""
     service = MagicMock()
@@ -33,23 +39,18 @@ def mock_content_scanner():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_get_current_admin():
     """Mock get_current_admin dependency."""
-    return User.model_construct(
-        user_id=uuid4(),
-        full_name="Admin User",
-        email="admin@test.com",
-        role="admin"
-    )
+    return ADMIN_USER
 
 
-@pytest.fixture
-def test_app(mock_fs_service, mock_content_scanner, mock_get_current_admin):
-    """Create test FastAPI app with mocked dependencies."""
-    app = FastAPI()
+@pytest.fixture(scope="module")
+def test_app(router_app, mock_fs_service, mock_content_scanner, mock_get_current_admin):
+    """Install this module's mocks on the shared app once."""
+    app = router_app
 
-    # Override dependencies before including router
+    # Override dependencies
     async def mock_get_current_admin_dep():
         return mock_get_current_admin
 
@@ -62,17 +63,24 @@ def test_app(mock_fs_service, mock_content_scanner, mock_get_current_admin):
     app.dependency_overrides[get_fs_service] = override_fs_service
     app.dependency_overrides[get_content_scanner] = override_content_scanner
     app.dependency_overrides[require_current_admin] = mock_get_current_admin_dep
-
-    app.include_router(admin_router, prefix="/api/admin")
-    return app
+    yield app
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
     """Test client."""
     return TestClient(test_app)
 
 
+@pytest.fixture(autouse=True)
+def reset_service_mocks(mock_fs_service, mock_content_scanner):
+    """Clear calls and per-test behaviour from the module-scoped mocks."""
+    mock_fs_service.reset_mock(return_value=True, side_effect=True)
+    mock_fs_service.path_exists.return_value = False
+    mock_content_scanner.reset_mock(return_value=True, side_effect=True)
+
+
 class TestAdminContentTree:
     def test_get_content_tree_success(self, client, mock_content_scanner):
         """Test successful content tree retrieval."""
@@ -111,7 +119,6 @@ class TestAdminConfigFile:
 
     def test_get_config_file_not_found(self, client, mock_fs_service):
         """Test config file not found."""
-        from src.core.errors import ContentFileNotFoundError
         mock_fs_service.read_file.side_effect = ContentFileNotFoundError("File not found")
 
         response = client.get("/api/admin/config-file?path=missing.yml")
@@ -135,7 +142,6 @@ class TestAdminConfigFile:
 
     def test_put_config_file_security_error(self, client, mock_fs_service, mock_content_scanner):
         """Test config file update with security error."""
-        from src.core.errors import SecurityError
         mock_fs_service.write_file.side_effect = SecurityError("Access denied")
 
         response = client.put(
@@ -237,7 +243,6 @@ class TestAdminDeleteItem:
         """Test successful directory deletion."""
         # Mock pathExists to return True for directory
         mock_fs_service.path_exists.return_value = True
-        mock_fs_service.delete_directory = AsyncMock()
 
         response = client.delete("/api/admin/item?path=test-dir")
 
@@ -247,7 +252,6 @@ class TestAdminDeleteItem:
 
     def test_delete_not_found(self, client, mock_fs_service, mock_content_scanner):
         """Test deletion of non-existent item."""
-        from src.core.errors import ContentFileNotFoundError
         mock_fs_service.path_exists.return_value = True
         mock_fs_service.delete_file.side_effect = ContentFileNotFoundError("Not found")
 
@@ -2,12 +2,21 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 from src.dependencies import require_current_user, get_db
 from src.routers.analytics_router import router as analytics_router
 from src.schemas.analytics import TrackEventRequest
 
+EXPECTED_LESSON_EVENT = TrackEventRequest(
+    activity_type="LESSON_COMPLETED",
+    details={"lesson_slug": "test-lesson", "course_slug": "test-course"},
+)
+EXPECTED_LOGIN_EVENT = TrackEventRequest(activity_type="LOGIN", details=None)
+
+# The analytics service is patched, so the session only needs a stable identity.
+DB_SENTINEL = object()
+
 
 @pytest.fixture
 def mock_analytics_service():
@@ -22,15 +31,13 @@ def mock_analytics_service():
 @pytest.fixture
 def mock_get_current_user():
     """Mock get_current_user dependency."""
-    user = MagicMock()
-    user.user_id = "test-user-id"
-    return user
+    return SimpleNamespace(user_id="test-user-id")
 
 
 @pytest.fixture
 def mock_get_db():
     """Mock get_db dependency."""
-    return MagicMock()
+    return DB_SENTINEL
 
 
 @pytest.fixture
@@ -56,6 +63,12 @@ def test_app(mock_analytics_service, mock_get_current_user, mock_get_db):
 @pytest.fixture
 def client(test_app):
     """Test client."""
+    return TestClient(test_app)
+
+
+@pytest.fixture
+def client_no_raise(test_app):
+    """Test client that turns unhandled server errors into 500 responses."""
     return TestClient(test_app, raise_server_exceptions=False)
 
 
@@ -74,7 +87,7 @@ class TestAnalyticsRouter:
         assert response.json() is None
         mock_analytics_service.track_activity.assert_awaited_once_with(
             user_id=mock_get_current_user.user_id,
-            event_data=TrackEventRequest(**request_data),
+            event_data=EXPECTED_LESSON_EVENT,
             db=mock_get_db,
         )
 
@@ -89,7 +102,7 @@ class TestAnalyticsRouter:
         assert response.status_code == 202
         mock_analytics_service.track_activity.assert_awaited_once_with(
             user_id=mock_get_current_user.user_id,
-            event_data=TrackEventRequest(activity_type="LOGIN", details=None),
+            event_data=EXPECTED_LOGIN_EVENT,
             db=mock_get_db,
         )
 
@@ -139,10 +152,10 @@ class TestAnalyticsRouter:
             mock_get_db,
         )
 
-    def test_get_user_activity_details_service_error(self, client, mock_analytics_service):
+    def test_get_user_activity_details_service_error(self, client_no_raise, mock_analytics_service):
         """Test activity details retrieval with service error."""
         mock_analytics_service.get_activity_details.side_effect = Exception("Database error")
 
-        response = client.get("/activity-log")
+        response = client_no_raise.get("/activity-log")
 
         assert response.status_code == 500
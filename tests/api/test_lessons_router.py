@@ -1,16 +1,20 @@
 import pytest
 from fastapi.testclient import TestClient
-from fastapi import FastAPI
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from src.api.v1 import lessons as lessons_module
-from src.api.v1.lessons import router as lessons_router
 from src.dependencies import get_content_scanner, get_fs_service, get_ulf_parser, require_current_admin
 from src.core.config import settings
+from src.core.errors import ContentFileNotFoundError, ParsingError, SecurityError
 from pathlib import Path
 
+UPDATED_LESSON = '---\ntitle: Updated Lesson\n---\n\nNew content'
+UPDATED_LESSON_BODY = UPDATED_LESSON.encode()
+INVALID_LESSON_BODY = b'---\ninvalid: yaml: [\n---\n\nContent'
+LESSON_BODY = b'---\ntitle: Lesson\n---\n\nContent'
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_fs_service():
     """Mock FileSystemService."""
     service = MagicMock()
@@ -19,7 +23,7 @@ def mock_fs_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ulf_parser():
     """Mock ULFParserService."""
     service = MagicMock()
@@ -27,7 +31,7 @@ def mock_ulf_parser():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_content_scanner():
     """Mock ContentScannerService."""
     service = MagicMock()
@@ -35,36 +39,45 @@ def mock_content_scanner():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_get_current_admin():
     """Mock get_current_admin dependency."""
     return MagicMock()
 
 
-@pytest.fixture
-def test_app(mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_get_current_admin):
-    """Create test FastAPI app with mocked dependencies."""
-    app = FastAPI()
-    app.include_router(lessons_router, prefix="/api/lessons")
+@pytest.fixture(scope="module")
+def test_app(router_app, mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_get_current_admin):
+    """Install this module's mocks on the shared app."""
+    app = router_app
 
     # Override dependencies
     app.dependency_overrides[get_fs_service] = lambda: mock_fs_service
     app.dependency_overrides[get_ulf_parser] = lambda: mock_ulf_parser
     app.dependency_overrides[get_content_scanner] = lambda: mock_content_scanner
     app.dependency_overrides[require_current_admin] = lambda: mock_get_current_admin
-    return app
+    yield app
+    app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(test_app):
     """Test client."""
-    return TestClient(test_app, raise_server_exceptions=False)
+    return TestClient(test_app)
+
+
+@pytest.fixture(autouse=True)
+def reset_service_mocks(mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_get_current_admin):
+    """Clear calls and per-test behaviour from the module-scoped mocks."""
+    for mock in (mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_get_current_admin):
+        mock.reset_mock(return_value=True, side_effect=True)
 
 
-@pytest.fixture
-def mock_find_lesson_file():
-    with patch("src.api.v1.lessons._find_lesson_file") as mock:
-        yield mock
+@pytest.fixture(autouse=True)
+def mock_find_lesson_file(monkeypatch):
+    """Replace lesson lookup so no test walks the real content tree."""
+    mock = MagicMock()
+    monkeypatch.setattr(lessons_module, "_find_lesson_file", mock)
+    return mock
 
 
 class TestLessonsRawGet:
@@ -90,7 +103,6 @@ class TestLessonsRawGet:
 
     def test_get_lesson_raw_security_error(self, client, mock_fs_service, mock_find_lesson_file):
         """Test raw lesson retrieval with security violation."""
-        from src.core.errors import SecurityError
         mock_find_lesson_file.return_value = Path(settings.CONTENT_ROOT) / "courses" / "course" / "test-slug.lesson"
         mock_fs_service.read_file.side_effect = SecurityError("Access denied")
 
@@ -103,32 +115,28 @@ class TestLessonsRawGet:
 class TestLessonsRawPut:
     def test_put_lesson_raw_success(self, client, mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_find_lesson_file):
         """Test successful raw lesson update."""
-        content = '---\ntitle: Updated Lesson\n---\n\nNew content'
         mock_ulf_parser.parse.return_value = {"title": "Updated Lesson", "cells": []}
         mock_find_lesson_file.return_value = Path(settings.CONTENT_ROOT) / "courses" / "course" / "test-slug.lesson"
 
         response = client.put(
             "/api/lessons/test-slug/raw",
-            data=content,
+            content=UPDATED_LESSON_BODY,
             headers={"Content-Type": "text/plain"}
         )
 
         assert response.status_code == 200
-        mock_ulf_parser.parse.assert_called_once_with(content)
-        mock_fs_service.write_file.assert_called_once_with("courses/course/test-slug.lesson", content)
+        mock_ulf_parser.parse.assert_called_once_with(UPDATED_LESSON)
+        mock_fs_service.write_file.assert_called_once_with("courses/course/test-slug.lesson", UPDATED_LESSON)
         mock_content_scanner.clear_cache.assert_called_once()
 
     def test_put_lesson_raw_parsing_error(self, client, mock_ulf_parser, mock_find_lesson_file):
         """Test raw lesson update with parsing error."""
-        from src.core.errors import ParsingError
         mock_ulf_parser.parse.side_effect = ParsingError("Invalid YAML")
         mock_find_lesson_file.return_value = Path(settings.CONTENT_ROOT) / "courses" / "course" / "test-slug.lesson"
 
-        content = '---\ninvalid: yaml: [\n---\n\nContent'
-
         response = client.put(
             "/api/lessons/test-slug/raw",
-            data=content,
+            content=INVALID_LESSON_BODY,
             headers={"Content-Type": "text/plain"}
         )
 
@@ -137,16 +145,13 @@ class TestLessonsRawPut:
 
     def test_put_lesson_raw_write_error(self, client, mock_fs_service, mock_ulf_parser, mock_content_scanner, mock_find_lesson_file):
         """Test raw lesson update with write error."""
-        from src.core.errors import ContentFileNotFoundError
         mock_ulf_parser.parse.return_value = {"title": "Lesson", "cells": []}
         mock_find_lesson_file.return_value = Path(settings.CONTENT_ROOT) / "courses" / "course" / "test-slug.lesson"
         mock_fs_service.write_file.side_effect = ContentFileNotFoundError("Cannot write")
 
-        content = '---\ntitle: Lesson\n---\n\nContent'
-
         response = client.put(
             "/api/lessons/test-slug/raw",
-            data=content,
+            content=LESSON_BODY,
             headers={"Content-Type": "text/plain"}
         )
 
@@ -161,7 +166,7 @@ class TestLessonsRawPut:
 
         response = client.put(
             "/api/lessons/test-slug/raw",
-            data="",
+            content=b"",
             headers={"Content-Type": "text/plain"}
         )
 
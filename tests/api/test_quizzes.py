@@ -1,181 +1,145 @@
-import os
-import sys
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from types import SimpleNamespace
+from uuid import UUID, uuid4
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
-os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
-os.environ.setdefault("SUPABASE_KEY", "test-key")
-os.environ.setdefault("SECRET_KEY", "test-secret")
-
-from src.main import app
 from src.schemas.user import User
 from src.core.security import get_current_user
-from src.api.v1.quizzes import get_answers_table
+from src.api.v1.quizzes import get_answers_table, router as quizzes_router
+from tests.api._asgi_call import call_json
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_current_user():
-    """Mock current user."""
-    return User(
-        user_id=uuid4(),
+    """Mock current user; no test mutates it, so one instance is shared."""
+    return User.model_construct(
+        user_id=UUID("11111111-1111-1111-1111-111111111111"),
         full_name="Test User",
         email="test@example.com",
         role="student"
     )
 
 
-@pytest.fixture
-def override_current_user(mock_current_user):
+class FakeAnswersTable:
+    """Stand-in for the answers table query chain.
+
+    ``eq(...)`` and ``single()`` return the table itself; ``execute`` raises
+    ``result`` if it is an exception, otherwise wraps it as the response data.
+    """
+
+    def __init__(self):
+        self.result = None
+
+    def eq(self, column, value):
+        return self
+
+    def single(self):
+        return self
+
+    async def execute(self):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return SimpleNamespace(data=self.result)
+
+
+@pytest.fixture(scope="session")
+def answers_table():
+    """Answers table fake shared by the whole session."""
+    return FakeAnswersTable()
+
+
+@pytest.fixture(scope="module")
+def test_app(mock_current_user, answers_table):
+    """Create a quizzes-only app that owns its dependency overrides."""
+    app = FastAPI()
+    app.include_router(quizzes_router, prefix="/api/v1/quizzes")
+
+    # Override dependencies
     app.dependency_overrides[get_current_user] = lambda: mock_current_user
-    yield
-    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides[get_answers_table] = lambda: answers_table
+    return app
 
 
 @pytest.fixture
-def override_answers_table():
-    """Override the answers table dependency."""
-    answers_table = MagicMock()
-    app.dependency_overrides[get_answers_table] = lambda: answers_table
+def override_answers_table(answers_table):
+    """Yield the shared answers table and clear its result after the test."""
     yield answers_table
-    app.dependency_overrides.pop(get_answers_table, None)
-
-
-@pytest.mark.asyncio
-async def test_check_quiz_answer_correct(mock_current_user, override_answers_table, override_current_user):
-    """Test successful quiz answer check with correct answer."""
-    answers_table = override_answers_table
-    correct_answer_id = str(uuid4())
-    question_id = str(uuid4())
-    selected_answer_id = correct_answer_id
-
-    # Mock the query chain
-    response_mock = MagicMock()
-    response_mock.data = {"correct_answer_id": correct_answer_id}
-    query_mock = MagicMock()
-    query_mock.execute = AsyncMock(return_value=response_mock)
-    answers_table.eq.return_value.single.return_value = query_mock
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-        payload = {
-            "question_id": question_id,
-            "selected_answer_id": selected_answer_id
-        }
-        response = await async_client.post("/api/v1/quizzes/answers/check", json=payload)
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["is_correct"] is True
-    assert data["correct_answer_id"] == correct_answer_id
-
-
-@pytest.mark.asyncio
-async def test_check_quiz_answer_incorrect(mock_current_user, override_answers_table, override_current_user):
-    """Test quiz answer check with incorrect answer."""
-    answers_table = override_answers_table
-    correct_answer_id = str(uuid4())
-    question_id = str(uuid4())
-    selected_answer_id = str(uuid4())  # Different from correct
-
-    # Mock the query chain
-    response_mock = MagicMock()
-    response_mock.data = {"correct_answer_id": correct_answer_id}
-    query_mock = MagicMock()
-    query_mock.execute = AsyncMock(return_value=response_mock)
-    answers_table.eq.return_value.single.return_value = query_mock
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-        payload = {
-            "question_id": question_id,
-            "selected_answer_id": selected_answer_id
-        }
-        response = await async_client.post("/api/v1/quizzes/answers/check", json=payload)
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["is_correct"] is False
-    assert data["correct_answer_id"] == correct_answer_id
-
-
-@pytest.mark.asyncio
-async def test_check_quiz_answer_question_not_found(mock_current_user, override_answers_table, override_current_user):
-    """Test quiz answer check when question is not found."""
-    answers_table = override_answers_table
-    question_id = str(uuid4())
-    selected_answer_id = str(uuid4())
-
-    # Mock the query chain to raise exception
-    query_mock = MagicMock()
-    query_mock.execute = AsyncMock(side_effect=Exception("Query failed"))
-    answers_table.eq.return_value.single.return_value = query_mock
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-        payload = {
-            "question_id": question_id,
-            "selected_answer_id": selected_answer_id
-        }
-        response = await async_client.post("/api/v1/quizzes/answers/check", json=payload)
-
-    assert response.status_code == 404
-    data = response.json()
-    assert "Question not found" in data["detail"]
-
-
-@pytest.mark.asyncio
-async def test_check_quiz_answer_database_exception(mock_current_user, override_answers_table, override_current_user):
-    """Test quiz answer check with database query exception."""
-    answers_table = override_answers_table
-    question_id = str(uuid4())
-    selected_answer_id = str(uuid4())
-
-    # Mock the query chain to raise exception
-    query_mock = MagicMock()
-    query_mock.execute = AsyncMock(side_effect=Exception("Database error"))
-    answers_table.eq.return_value.single.return_value = query_mock
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-        payload = {
-            "question_id": question_id,
-            "selected_answer_id": selected_answer_id
-        }
-        response = await async_client.post("/api/v1/quizzes/answers/check", json=payload)
-
-    assert response.status_code == 404
-    data = response.json()
-    assert "Question not found" in data["detail"]
-
-
-@pytest.mark.asyncio
-async def test_check_quiz_answer_missing_correct_answer_id(mock_current_user, override_answers_table, override_current_user):
-    """Test quiz answer check when correct_answer_id is missing."""
-    answers_table = override_answers_table
-    question_id = str(uuid4())
-    selected_answer_id = str(uuid4())
-
-    # Mock the query chain
-    response_mock = MagicMock()
-    response_mock.data = {}  # No correct_answer_id
-    query_mock = MagicMock()
-    query_mock.execute = AsyncMock(return_value=response_mock)
-    answers_table.eq.return_value.single.return_value = query_mock
-
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-        payload = {
-            "question_id": question_id,
-            "selected_answer_id": selected_answer_id
-        }
-        response = await async_client.post("/api/v1/quizzes/answers/check", json=payload)
-
-    assert response.status_code == 404
-    data = response.json()
-    assert "Question not found" in data["detail"]
+    answers_table.result = None
+
+
+def _assert_quiz_response(status, data, expected_status, expected_body):
+    """Check the status code and each expected field; ``detail`` matches by substring."""
+    assert status == expected_status
+    for key, value in expected_body.items():
+        if key == "detail":
+            assert value in data["detail"]
+        else:
+            assert data[key] == value
+
+
+QUESTION_ID = str(uuid4())
+CORRECT_ANSWER_ID = str(uuid4())
+WRONG_ANSWER_ID = str(uuid4())
+
+
+@pytest.mark.parametrize(
+    "query_result, selected_answer_id, expected_status, expected_body",
+    [
+        pytest.param(
+            {"correct_answer_id": CORRECT_ANSWER_ID},
+            CORRECT_ANSWER_ID,
+            200,
+            {"is_correct": True, "correct_answer_id": CORRECT_ANSWER_ID},
+            id="correct",
+        ),
+        pytest.param(
+            {"correct_answer_id": CORRECT_ANSWER_ID},
+            WRONG_ANSWER_ID,
+            200,
+            {"is_correct": False, "correct_answer_id": CORRECT_ANSWER_ID},
+            id="incorrect",
+        ),
+        pytest.param(
+            Exception("Query failed"),
+            WRONG_ANSWER_ID,
+            404,
+            {"detail": "Question not found"},
+            id="question_not_found",
+        ),
+        pytest.param(
+            Exception("Database error"),
+            WRONG_ANSWER_ID,
+            404,
+            {"detail": "Question not found"},
+            id="database_exception",
+        ),
+        pytest.param(
+            {},  # No correct_answer_id
+            WRONG_ANSWER_ID,
+            404,
+            {"detail": "Question not found"},
+            id="missing_correct_answer_id",
+        ),
+    ],
+)
+async def test_check_quiz_answer(
+    test_app,
+    override_answers_table,
+    query_result,
+    selected_answer_id,
+    expected_status,
+    expected_body,
+):
+    """Test quiz answer check for each query outcome."""
+    override_answers_table.result = query_result
+
+    payload = {
+        "question_id": QUESTION_ID,
+        "selected_answer_id": selected_answer_id
+    }
+    status, data = await call_json(test_app, "POST", "/api/v1/quizzes/answers/check", payload)
+
+    _assert_quiz_response(status, data, expected_status, expected_body)
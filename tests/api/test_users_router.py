@@ -1,10 +1,11 @@
 import pytest
-import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
+from collections import namedtuple
+from types import SimpleNamespace
 from datetime import datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from src.dependencies import get_db, require_current_admin, get_content_scanner
 from src.routers.admin.users_router import (
@@ -14,13 +15,39 @@ from src.routers.admin.users_router import (
     router as users_router,
 )
 from src.schemas import UsersListResponse, UserResponse, UserFilter
-from src.models.user import User
 from src.models.enrollment import Enrollment
 
-pytestmark = pytest.mark.asyncio
+# The router only reads attributes off returned users, so an ORM instance is not needed.
+FakeUser = namedtuple("FakeUser", "id full_name email role status registration_date")
 
 
-@pytest.fixture
+class FakeResult:
+    """Query result exposing the scalar accessors the router calls."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar(self):
+        return self._value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class FakeDB:
+    """Async session stand-in whose ``execute`` returns queued results in order."""
+
+    def __init__(self):
+        self.results = []
+
+    def queue(self, *results):
+        self.results.extend(results)
+
+    async def execute(self, statement):
+        return self.results.pop(0)
+
+
+@pytest.fixture(scope="session")
 def mock_user_service():
     """Mock UserService."""
     service = MagicMock()
@@ -28,7 +55,7 @@ def mock_user_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_progress_service():
     """Mock ProgressService."""
     service = MagicMock()
@@ -36,7 +63,7 @@ def mock_progress_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_analytics_service():
     """Mock AnalyticsService."""
     service = MagicMock()
@@ -44,7 +71,7 @@ def mock_analytics_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_content_scanner():
     """Mock ContentScannerService."""
     service = MagicMock()
@@ -52,23 +79,22 @@ def mock_content_scanner():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_get_current_admin():
     """Mock get_current_admin dependency."""
     admin = MagicMock()
-    admin.id = uuid4()
+    admin.id = UUID("22222222-2222-2222-2222-222222222222")
     admin.role = "admin"
     return admin
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_db():
-    """Mock database session."""
-    db = AsyncMock()
-    return db
+    """Fake database session."""
+    return FakeDB()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app(mock_user_service, mock_progress_service, mock_analytics_service, mock_content_scanner, mock_get_current_admin, mock_db):
     """Create test FastAPI app with mocked dependencies."""
     app = FastAPI()
@@ -84,30 +110,35 @@ def test_app(mock_user_service, mock_progress_service, mock_analytics_service, m
     return app
 
 
-@pytest_asyncio.fixture
-async def client(test_app):
-    """Async test client."""
-    transport = ASGITransport(app=test_app)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
-        yield ac
+@pytest.fixture(autouse=True)
+def reset_service_mocks(mock_user_service, mock_progress_service, mock_analytics_service, mock_content_scanner, mock_get_current_admin, mock_db):
+    """Clear calls and per-test behaviour from the session-scoped mocks."""
+    for mock in (mock_user_service, mock_progress_service, mock_analytics_service, mock_content_scanner):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_get_current_admin.reset_mock()
+    mock_db.results.clear()
+
+
+@pytest.fixture(scope="session")
+def client(test_app):
+    """Test client shared by the session (one per xdist worker)."""
+    return TestClient(test_app)
 
 
 class TestListUsers:
-    async def test_list_users_success_no_filters(self, client, mock_user_service, mock_db):
+    def test_list_users_success_no_filters(self, client, mock_user_service, mock_db):
         """Test successful user listing without filters."""
         # Mock users
         mock_users = [
-            User(id=uuid4(), full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now()),
-            User(id=uuid4(), full_name="Jane Smith", email="jane@example.com", role="ADMIN", status="ACTIVE", registration_date=datetime.now()),
+            FakeUser(id=uuid4(), full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now()),
+            FakeUser(id=uuid4(), full_name="Jane Smith", email="jane@example.com", role="ADMIN", status="ACTIVE", registration_date=datetime.now()),
         ]
         mock_user_service.list_users.return_value = mock_users
 
         # Mock count query
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = 2
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(FakeResult(2))
 
-        response = await client.get("/api/admin/users/")
+        response = client.get("/api/admin/users/")
 
         assert response.status_code == 200
         data = response.json()
@@ -119,19 +150,17 @@ class TestListUsers:
         assert data["page_size"] == 100
         mock_user_service.list_users.assert_called_once_with(db=mock_db, filters=UserFilter())
 
-    async def test_list_users_success_with_filters(self, client, mock_user_service, mock_db):
+    def test_list_users_success_with_filters(self, client, mock_user_service, mock_db):
         """Test successful user listing with filters."""
         mock_users = [
-            User(id=uuid4(), full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now()),
+            FakeUser(id=uuid4(), full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now()),
         ]
         mock_user_service.list_users.return_value = mock_users
 
         # Mock count query
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = 1
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(FakeResult(1))
 
-        response = await client.get("/api/admin/users/?search=john&role=STUDENT&limit=5")
+        response = client.get("/api/admin/users/?search=john&role=STUDENT&limit=5")
 
         assert response.status_code == 200
         data = response.json()
@@ -141,18 +170,16 @@ class TestListUsers:
         filters = UserFilter(search="john", role="STUDENT", limit=5)
         mock_user_service.list_users.assert_called_once_with(db=mock_db, filters=filters)
 
-    async def test_list_users_success_pagination(self, client, mock_user_service, mock_db):
+    def test_list_users_success_pagination(self, client, mock_user_service, mock_db):
         """Test user listing with pagination."""
         mock_users = [
-            User(id=uuid4(), full_name="Jane Smith", email="jane@example.com", role="ADMIN", status="ACTIVE", registration_date=datetime.now()),
+            FakeUser(id=uuid4(), full_name="Jane Smith", email="jane@example.com", role="ADMIN", status="ACTIVE", registration_date=datetime.now()),
         ]
         mock_user_service.list_users.return_value = mock_users
 
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = 12
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(FakeResult(12))
 
-        response = await client.get("/api/admin/users/?skip=10&limit=5")
+        response = client.get("/api/admin/users/?skip=10&limit=5")
 
         assert response.status_code == 200
         data = response.json()
@@ -161,28 +188,25 @@ class TestListUsers:
         assert data["current_page"] == 3  # 10//5 + 1
         assert data["page_size"] == 5
 
-    async def test_list_users_database_error(self, client, mock_user_service, mock_db):
+    def test_list_users_database_error(self, client, mock_user_service, mock_db):
         """Test list_users with database error."""
         mock_user_service.list_users.side_effect = Exception("Database error")
 
-        response = await client.get("/api/admin/users/")
+        response = client.get("/api/admin/users/")
 
         assert response.status_code == 500
 
 
 class TestGetUserDetails:
-    async def test_get_user_details_success(self, client, mock_db, mock_progress_service, mock_analytics_service):
+    def test_get_user_details_success(self, client, mock_db, mock_progress_service, mock_analytics_service):
         """Test successful user details retrieval."""
         # Mock user
         user_id = uuid4()
-        mock_user = User(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
-        user_result = MagicMock()
-        user_result.scalar_one_or_none.return_value = mock_user
+        mock_user = FakeUser(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
 
         # Mock enrollments
-        mock_enrollment_result = MagicMock()
-        mock_enrollment_result.__iter__ = lambda self: iter([MagicMock(course_slug="course1"), MagicMock(course_slug="course2")])
-        mock_db.execute.side_effect = [user_result, mock_enrollment_result]
+        enrollments = [SimpleNamespace(course_slug="course1"), SimpleNamespace(course_slug="course2")]
+        mock_db.queue(FakeResult(mock_user), enrollments)
 
         # Mock progress
         mock_progress_service.get_user_progress_for_course.return_value = {"completed": 5, "total": 10}
@@ -190,7 +214,7 @@ class TestGetUserDetails:
         # Mock activity
         mock_analytics_service.get_activity_details.return_value = [{"date": "2023-10-01", "LOGIN": 2}]
 
-        response = await client.get(f"/api/admin/users/{user_id}/details")
+        response = client.get(f"/api/admin/users/{user_id}/details")
 
         assert response.status_code == 200
         data = response.json()
@@ -201,48 +225,39 @@ class TestGetUserDetails:
         assert data["progress"]["course2"] == {"completed": 5, "total": 10}
         mock_analytics_service.get_activity_details.assert_called_once_with(user_id=user_id, db=mock_db)
 
-    async def test_get_user_details_user_not_found(self, client, mock_db):
+    def test_get_user_details_user_not_found(self, client, mock_db):
         """Test user details when user not found."""
-        user_result = MagicMock()
-        user_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = user_result
+        mock_db.queue(FakeResult(None))
 
         missing_user_id = uuid4()
-        response = await client.get(f"/api/admin/users/{missing_user_id}/details")
+        response = client.get(f"/api/admin/users/{missing_user_id}/details")
 
         assert response.status_code == 404
         assert "User not found" in response.json()["detail"]
 
-    async def test_get_user_details_progress_service_error(self, client, mock_db, mock_progress_service, mock_analytics_service):
+    def test_get_user_details_progress_service_error(self, client, mock_db, mock_progress_service, mock_analytics_service):
         """Test user details with progress service error."""
         user_id = uuid4()
-        mock_user = User(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
-        user_result = MagicMock()
-        user_result.scalar_one_or_none.return_value = mock_user
+        mock_user = FakeUser(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
 
-        mock_enrollment_result = MagicMock()
-        mock_enrollment_result.__iter__ = lambda self: iter([MagicMock(course_slug="course1")])
-        mock_db.execute.side_effect = [user_result, mock_enrollment_result]
+        enrollments = [SimpleNamespace(course_slug="course1")]
+        mock_db.queue(FakeResult(mock_user), enrollments)
 
         mock_progress_service.get_user_progress_for_course.side_effect = Exception("Progress error")
 
-        response = await client.get(f"/api/admin/users/{user_id}/details")
+        response = client.get(f"/api/admin/users/{user_id}/details")
 
         assert response.status_code == 500
 
-    async def test_get_user_details_analytics_service_error(self, client, mock_db, mock_progress_service, mock_analytics_service):
+    def test_get_user_details_analytics_service_error(self, client, mock_db, mock_progress_service, mock_analytics_service):
         """Test user details with analytics service error."""
         user_id = uuid4()
-        mock_user = User(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
-        user_result = MagicMock()
-        user_result.scalar_one_or_none.return_value = mock_user
+        mock_user = FakeUser(id=user_id, full_name="John Doe", email="john@example.com", role="STUDENT", status="ACTIVE", registration_date=datetime.now())
 
-        mock_enrollment_result = MagicMock()
-        mock_enrollment_result.__iter__ = lambda self: iter([])
-        mock_db.execute.side_effect = [user_result, mock_enrollment_result]
+        mock_db.queue(FakeResult(mock_user), [])
 
         mock_analytics_service.get_activity_details.side_effect = Exception("Analytics error")
 
-        response = await client.get(f"/api/admin/users/{user_id}/details")
+        response = client.get(f"/api/admin/users/{user_id}/details")
 
         assert response.status_code == 500
@@ -1,12 +1,61 @@
 """Pytest configuration helpers."""
+import asyncio
 import os
 import sys
 from pathlib import Path
 
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - not installed on Windows/PyPy
+    uvloop = None
+
 # Ensure email validation does not perform DNS lookups during tests.
 os.environ["EMAIL_CHECK_DELIVERABILITY"] = "false"
 
+# Placeholder credentials so importing settings never fails; real values win.
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
 # Ensure the project root is available on sys.path so that `import src` works.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The real application, imported on first use rather than at collection."""
+    from src.main import app as main_app
+
+    return main_app
+
+
+@pytest.fixture(scope="session")
+def router_app():
+    """Admin, lessons and analytics routers on one app, shared by the router and integration tests.
+
+    Routes are registered once per session; each module installs its own
+    ``dependency_overrides`` and clears them on teardown.
+    """
+    from fastapi import FastAPI
+
+    from src.api.v1.admin import router as admin_router
+    from src.api.v1.lessons import router as lessons_router
+    from src.routers.analytics_router import router as analytics_router
+
+    app = FastAPI()
+    app.include_router(admin_router, prefix="/api/admin")
+    app.include_router(lessons_router, prefix="/api/lessons")
+    app.include_router(analytics_router, prefix="/api")
+    return app
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop, the loop uvicorn uses, where it is installed."""
+    if uvloop is None:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
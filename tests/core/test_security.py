@@ -1,11 +1,11 @@
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID
 
 from fastapi import HTTPException
 from jwt import ExpiredSignatureError, PyJWTError
 
+from src.core.config import settings
 from src.core.security import (
     create_access_token,
     create_refresh_token,
@@ -15,21 +15,72 @@ from src.core.security import (
 )
 from src.schemas.user import User
 
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+ADMIN_ID = UUID("22222222-2222-2222-2222-222222222222")
 
-@pytest.fixture
+# Read-only inputs, built once without re-running validation.
+SAMPLE_USER = User.model_construct(
+    user_id=USER_ID,
+    full_name="Test User",
+    email="test@example.com",
+    role="student",
+)
+ADMIN_USER = User.model_construct(
+    user_id=ADMIN_ID,
+    full_name="Admin User",
+    email="admin@example.com",
+    role="admin",
+)
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
-    """Mock settings for testing."""
-    with patch("src.core.security.settings") as mock_settings:
-        mock_settings.SECRET_KEY = "test-secret-key"
-        mock_settings.ALGORITHM = "HS256"
-        yield mock_settings
+    """Pin the signing settings for the whole session; they are constants here."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr("src.core.security.settings.SECRET_KEY", "test-secret-key")
+    mp.setattr("src.core.security.settings.ALGORITHM", "HS256")
+    yield settings
+    mp.undo()
+
+
+class JwtStub:
+    """Stand-in for the ``jwt`` functions used by ``src.core.security``.
+
+    ``encode`` records its payload and returns a fixed token; ``decode`` records
+    its arguments and raises ``decode_result`` if it is an exception, otherwise
+    returns it.
+    """
+
+    def __init__(self):
+        self.encoded_payloads = []
+        self.decode_calls = []
+        self.decode_result = None
+
+    def encode(self, payload, key, algorithm=None):
+        self.encoded_payloads.append(payload)
+        return "mocked-token"
+
+    def decode(self, token, key, algorithms=None):
+        self.decode_calls.append((token, key, algorithms))
+        if isinstance(self.decode_result, Exception):
+            raise self.decode_result
+        return self.decode_result
+
+
+@pytest.fixture
+def jwt_stub(monkeypatch):
+    """Replace ``jwt.encode``/``jwt.decode`` as seen by the security module."""
+    stub = JwtStub()
+    monkeypatch.setattr("src.core.security.jwt.encode", stub.encode)
+    monkeypatch.setattr("src.core.security.jwt.decode", stub.decode)
+    return stub
 
 
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
     return {
-        "sub": str(uuid4()),
+        "sub": str(USER_ID),
         "email": "test@example.com",
     }
 
@@ -37,201 +88,149 @@ def sample_user_data():
 @pytest.fixture
 def sample_user():
     """Sample User object for testing."""
-    return User(
-        user_id=uuid4(),
-        full_name="Test User",
-        email="test@example.com",
-        role="student",
-    )
+    return SAMPLE_USER
 
 
 @pytest.fixture
 def admin_user():
     """Sample admin User object for testing."""
-    return User(
-        user_id=uuid4(),
-        full_name="Admin User",
-        email="admin@example.com",
-        role="admin",
-    )
+    return ADMIN_USER
 
 
 class TestCreateAccessToken:
-    def test_create_access_token_default_expiration(self, mock_settings, sample_user_data):
-        """Test creating access token with default expiration."""
-        token = create_access_token(sample_user_data)
-
-        assert isinstance(token, str)
-        assert len(token) > 0
-
-    def test_create_access_token_custom_expiration(self, mock_settings, sample_user_data):
-        """Test creating access token with custom expiration."""
-        custom_expires = timedelta(minutes=30)
-        token = create_access_token(sample_user_data, expires_delta=custom_expires)
+    @pytest.mark.parametrize(
+        "expires_delta",
+        [
+            pytest.param(None, id="default_expiration"),
+            pytest.param(timedelta(minutes=30), id="custom_expiration"),
+        ],
+    )
+    def test_create_access_token_expiration(self, mock_settings, sample_user_data, expires_delta):
+        """Test creating access token with default and custom expiration."""
+        token = create_access_token(sample_user_data, expires_delta=expires_delta)
 
         assert isinstance(token, str)
         assert len(token) > 0
 
-    def test_create_access_token_payload_encoding(self, mock_settings, sample_user_data):
+    def test_create_access_token_payload_encoding(self, mock_settings, jwt_stub, sample_user_data):
         """Test that access token encodes payload correctly."""
-        with patch("jwt.encode") as mock_encode:
-            mock_encode.return_value = "mocked-token"
-            token = create_access_token(sample_user_data)
+        token = create_access_token(sample_user_data)
 
-            # Check that encode was called with correct data
-            call_args = mock_encode.call_args[0][0]  # First positional argument
-            assert call_args["sub"] == sample_user_data["sub"]
-            assert call_args["email"] == sample_user_data["email"]
-            assert call_args["type"] == "access"
-            assert "exp" in call_args
-            assert isinstance(call_args["exp"], datetime)
+        assert token == "mocked-token"
+        # Check that encode was called with correct data
+        payload, = jwt_stub.encoded_payloads
+        assert payload["sub"] == sample_user_data["sub"]
+        assert payload["email"] == sample_user_data["email"]
+        assert payload["type"] == "access"
+        assert "exp" in payload
+        assert isinstance(payload["exp"], datetime)
 
 
 class TestCreateRefreshToken:
-    def test_create_refresh_token_default_expiration(self, mock_settings, sample_user_data):
-        """Test creating refresh token with default expiration."""
-        token = create_refresh_token(sample_user_data)
-
-        assert isinstance(token, str)
-        assert len(token) > 0
-
-    def test_create_refresh_token_custom_expiration(self, mock_settings, sample_user_data):
-        """Test creating refresh token with custom expiration."""
-        custom_expires = timedelta(days=14)
-        token = create_refresh_token(sample_user_data, expires_delta=custom_expires)
+    @pytest.mark.parametrize(
+        "expires_delta",
+        [
+            pytest.param(None, id="default_expiration"),
+            pytest.param(timedelta(days=14), id="custom_expiration"),
+        ],
+    )
+    def test_create_refresh_token_expiration(self, mock_settings, sample_user_data, expires_delta):
+        """Test creating refresh token with default and custom expiration."""
+        token = create_refresh_token(sample_user_data, expires_delta=expires_delta)
 
         assert isinstance(token, str)
         assert len(token) > 0
 
-    def test_create_refresh_token_payload_encoding(self, mock_settings, sample_user_data):
+    def test_create_refresh_token_payload_encoding(self, mock_settings, jwt_stub, sample_user_data):
         """Test that refresh token encodes payload correctly."""
-        with patch("jwt.encode") as mock_encode:
-            mock_encode.return_value = "mocked-token"
-            token = create_refresh_token(sample_user_data)
+        token = create_refresh_token(sample_user_data)
 
-            # Check that encode was called with correct data
-            call_args = mock_encode.call_args[0][0]
-            assert call_args["sub"] == sample_user_data["sub"]
-            assert call_args["email"] == sample_user_data["email"]
-            assert call_args["type"] == "refresh"
-            assert "exp" in call_args
-            assert isinstance(call_args["exp"], datetime)
+        assert token == "mocked-token"
+        # Check that encode was called with correct data
+        payload, = jwt_stub.encoded_payloads
+        assert payload["sub"] == sample_user_data["sub"]
+        assert payload["email"] == sample_user_data["email"]
+        assert payload["type"] == "refresh"
+        assert "exp" in payload
+        assert isinstance(payload["exp"], datetime)
 
 
 class TestVerifyRefreshToken:
-    def test_verify_refresh_token_valid(self, mock_settings, sample_user_data):
+    def test_verify_refresh_token_valid(self, mock_settings, jwt_stub, sample_user_data):
         """Test verifying a valid refresh token."""
         sample_user_data["type"] = "refresh"
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.return_value = sample_user_data
-            payload = verify_refresh_token("valid-token")
-
-            assert payload == sample_user_data
-            mock_decode.assert_called_once_with(
-                "valid-token",
-                mock_settings.SECRET_KEY,
-                algorithms=[mock_settings.ALGORITHM]
-            )
-
-    def test_verify_refresh_token_expired(self, mock_settings):
-        """Test verifying an expired refresh token."""
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.side_effect = ExpiredSignatureError("Token expired")
-
-            with pytest.raises(HTTPException) as exc_info:
-                verify_refresh_token("expired-token")
-
-            assert exc_info.value.status_code == 401
-            assert "Refresh token expired" in exc_info.value.detail
-
-    def test_verify_refresh_token_invalid(self, mock_settings):
-        """Test verifying an invalid refresh token."""
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.side_effect = PyJWTError("Invalid token")
-
-            with pytest.raises(HTTPException) as exc_info:
-                verify_refresh_token("invalid-token")
-
-            assert exc_info.value.status_code == 401
-            assert "Invalid refresh token" in exc_info.value.detail
-
-    def test_verify_refresh_token_wrong_type(self, mock_settings, sample_user_data):
-        """Test verifying a token with wrong type."""
-        sample_user_data["type"] = "access"  # Wrong type for refresh token
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.return_value = sample_user_data
+        jwt_stub.decode_result = sample_user_data
+        payload = verify_refresh_token("valid-token")
+
+        assert payload == sample_user_data
+        assert jwt_stub.decode_calls == [
+            ("valid-token", mock_settings.SECRET_KEY, [mock_settings.ALGORITHM])
+        ]
+
+    @pytest.mark.parametrize(
+        "decode_result, expected_detail",
+        [
+            pytest.param(ExpiredSignatureError("Token expired"), "Refresh token expired", id="expired"),
+            pytest.param(PyJWTError("Invalid token"), "Invalid refresh token", id="invalid"),
+            pytest.param(
+                {"sub": str(USER_ID), "email": "test@example.com", "type": "access"},  # Wrong type for refresh token
+                "Invalid token type",
+                id="wrong_type",
+            ),
+        ],
+    )
+    def test_verify_refresh_token_rejected(self, mock_settings, jwt_stub, decode_result, expected_detail):
+        """Test that expired, invalid and wrong-type refresh tokens are rejected."""
+        jwt_stub.decode_result = decode_result
 
-            with pytest.raises(HTTPException) as exc_info:
-                verify_refresh_token("wrong-type-token")
+        with pytest.raises(HTTPException) as exc_info:
+            verify_refresh_token("rejected-token")
 
-            assert exc_info.value.status_code == 401
-            assert "Invalid token type" in exc_info.value.detail
+        assert exc_info.value.status_code == 401
+        assert expected_detail in exc_info.value.detail
 
 
 class TestGetCurrentUser:
     @pytest.mark.asyncio
-    async def test_get_current_user_valid(self, mock_settings, sample_user_data, sample_user):
+    async def test_get_current_user_valid(self, mock_settings, jwt_stub, sample_user_data, sample_user):
         """Test getting current user with valid access token."""
         sample_user_data["type"] = "access"
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.return_value = sample_user_data
+        jwt_stub.decode_result = sample_user_data
 
-            user = await get_current_user("valid-token")
+        user = await get_current_user("valid-token")
 
-            assert isinstance(user, User)
-            assert str(user.user_id) == sample_user_data["sub"]
-            assert user.email == sample_user_data["email"]
-            assert user.role == "student"  # Default role
+        assert isinstance(user, User)
+        assert str(user.user_id) == sample_user_data["sub"]
+        assert user.email == sample_user_data["email"]
+        assert user.role == "student"  # Default role
 
     @pytest.mark.asyncio
-    async def test_get_current_user_expired(self, mock_settings):
-        """Test getting current user with expired token."""
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.side_effect = ExpiredSignatureError("Token expired")
-
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user("expired-token")
-
-            assert exc_info.value.status_code == 401
-            assert "Token expired" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_get_current_user_invalid(self, mock_settings):
-        """Test getting current user with invalid token."""
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.side_effect = PyJWTError("Invalid token")
-
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user("invalid-token")
-
-            assert exc_info.value.status_code == 401
-            assert "Invalid authentication credentials" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_get_current_user_wrong_type(self, mock_settings, sample_user_data):
-        """Test getting current user with wrong token type."""
-        sample_user_data["type"] = "refresh"  # Wrong type for access
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.return_value = sample_user_data
-
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user("wrong-type-token")
-
-            assert exc_info.value.status_code == 401
-            assert "Invalid token type" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_get_current_user_missing_payload(self, mock_settings):
-        """Test getting current user with missing payload data."""
-        incomplete_payload = {"type": "access"}  # Missing sub and email
-        with patch("jwt.decode") as mock_decode:
-            mock_decode.return_value = incomplete_payload
+    @pytest.mark.parametrize(
+        "decode_result, expected_detail",
+        [
+            pytest.param(ExpiredSignatureError("Token expired"), "Token expired", id="expired"),
+            pytest.param(PyJWTError("Invalid token"), "Invalid authentication credentials", id="invalid"),
+            pytest.param(
+                {"sub": str(USER_ID), "email": "test@example.com", "type": "refresh"},  # Wrong type for access
+                "Invalid token type",
+                id="wrong_type",
+            ),
+            pytest.param(
+                {"type": "access"},  # Missing sub and email
+                "Invalid token payload",
+                id="missing_payload",
+            ),
+        ],
+    )
+    async def test_get_current_user_rejected(self, mock_settings, jwt_stub, decode_result, expected_detail):
+        """Test that unusable access tokens are rejected with 401."""
+        jwt_stub.decode_result = decode_result
 
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user("incomplete-token")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user("rejected-token")
 
-            assert exc_info.value.status_code == 401
-            assert "Invalid token payload" in exc_info.value.detail
+        assert exc_info.value.status_code == 401
+        assert expected_detail in exc_info.value.detail
 
 
 class TestGetCurrentAdmin:
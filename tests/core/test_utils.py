@@ -1,9 +1,18 @@
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from loguru import logger
+from unittest.mock import MagicMock, AsyncMock
 from src.core.utils import finalize_supabase_result
 from src.core.errors import ExternalServiceError
 
 
+@pytest.fixture
+def caplog(caplog):
+    """Route loguru records into pytest's caplog handler for the test."""
+    handler_id = logger.add(caplog.handler, format="{message}", level="DEBUG")
+    yield caplog
+    logger.remove(handler_id)
+
+
 class TestFinalizeSupabaseResult:
     @pytest.mark.asyncio
     async def test_finalize_sync_result(self):
@@ -51,27 +60,27 @@ class TestFinalizeSupabaseResult:
         assert final_result == {"final": "data"}
 
     @pytest.mark.asyncio
-    async def test_finalize_result_execute_raises_exception(self):
+    async def test_finalize_result_execute_raises_exception(self, caplog):
         """Test error handling when execute raises an exception."""
         mock_result = MagicMock()
         mock_result.execute.side_effect = Exception("Execute failed")
 
-        with patch("src.core.utils.logger") as mock_logger:
-            with pytest.raises(ExternalServiceError) as exc_info:
-                await finalize_supabase_result(mock_result)
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await finalize_supabase_result(mock_result)
 
         assert "Failed to process Supabase query result: Execute failed" in str(exc_info.value)
-        mock_logger.error.assert_called_once_with("Error finalizing Supabase result: Execute failed")
+        assert caplog.records[-1].message == "Error finalizing Supabase result: Execute failed"
+        assert caplog.records[-1].levelname == "ERROR"
 
     @pytest.mark.asyncio
-    async def test_finalize_async_result_raises_exception(self):
+    async def test_finalize_async_result_raises_exception(self, caplog):
         """Test error handling when awaiting raises an exception."""
-        with patch("src.core.utils.logger") as mock_logger:
-            with pytest.raises(ExternalServiceError) as exc_info:
-                async def failing():
-                    raise Exception("Async failed")
+        async def failing():
+            raise Exception("Async failed")
 
-                await finalize_supabase_result(failing())
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await finalize_supabase_result(failing())
 
         assert "Failed to process Supabase query result: Async failed" in str(exc_info.value)
-        mock_logger.error.assert_called_once_with("Error finalizing Supabase result: Async failed")
+        assert caplog.records[-1].message == "Error finalizing Supabase result: Async failed"
+        assert caplog.records[-1].levelname == "ERROR"
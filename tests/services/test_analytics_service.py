@@ -1,179 +1,109 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from datetime import date, datetime, timedelta
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
 from src.services.analytics_service import AnalyticsService
 from src.models.user_activity_log import UserActivityLog
 from src.schemas import TrackEventRequest
 
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class TestAnalyticsService:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_db(self):
-        return AsyncMock()
-
-    async def test_get_activity_details_with_data(self, mock_db):
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.fixture(autouse=True)
+    def reset_mock_db(self, mock_db):
+        """Clear calls and configured results left on the shared session mock."""
+        mock_db.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.mark.parametrize(
+        "rows, expected",
+        [
+            pytest.param(
+                [
+                    SimpleNamespace(date=date(2024, 10, 1), activity_type='LESSON_COMPLETED', count=3),
+                    SimpleNamespace(date=date(2024, 10, 1), activity_type='QUIZ_ATTEMPT', count=1),
+                    SimpleNamespace(date=date(2024, 10, 2), activity_type='LESSON_COMPLETED', count=2),
+                ],
+                [
+                    {'date': '2024-10-01', 'LESSON_COMPLETED': 3, 'QUIZ_ATTEMPT': 1},
+                    {'date': '2024-10-02', 'LESSON_COMPLETED': 2},
+                ],
+                id="with_data",
+            ),
+            pytest.param([], [], id="empty_result"),
+            pytest.param(
+                [SimpleNamespace(date=date(2024, 10, 1), activity_type='LOGIN', count=5)],
+                [{'date': '2024-10-01', 'LOGIN': 5}],
+                id="single_activity_type",
+            ),
+            pytest.param(
+                # Rows arrive out of date order; the result is sorted by date
+                [
+                    SimpleNamespace(date=d, activity_type='LESSON_COMPLETED', count=i + 1)
+                    for i, d in enumerate((date(2024, 9, 30), date(2024, 10, 1), date(2024, 9, 29)))
+                ],
+                [
+                    {'date': '2024-09-29', 'LESSON_COMPLETED': 3},
+                    {'date': '2024-09-30', 'LESSON_COMPLETED': 1},
+                    {'date': '2024-10-01', 'LESSON_COMPLETED': 2},
+                ],
+                id="multiple_dates",
+            ),
+            pytest.param(
+                [
+                    SimpleNamespace(date=date(2024, 10, 1), activity_type=t, count=c)
+                    for t, c in zip(('LESSON_COMPLETED', 'CODE_EXECUTION', 'QUIZ_ATTEMPT'), (3, 7, 2))
+                ],
+                [{'date': '2024-10-01', 'LESSON_COMPLETED': 3, 'CODE_EXECUTION': 7, 'QUIZ_ATTEMPT': 2}],
+                id="same_date_different_types",
+            ),
+        ],
+    )
+    async def test_get_activity_details(self, mock_db, rows, expected):
         # Arrange
         user_id = 1
-
-        # Mock query results
-        mock_row1 = MagicMock()
-        mock_row1.date = datetime(2024, 10, 1).date()
-        mock_row1.activity_type = 'LESSON_COMPLETED'
-        mock_row1.count = 3
-
-        mock_row2 = MagicMock()
-        mock_row2.date = datetime(2024, 10, 1).date()
-        mock_row2.activity_type = 'QUIZ_ATTEMPT'
-        mock_row2.count = 1
-
-        mock_row3 = MagicMock()
-        mock_row3.date = datetime(2024, 10, 2).date()
-        mock_row3.activity_type = 'LESSON_COMPLETED'
-        mock_row3.count = 2
-
-        mock_db.execute.return_value.all.return_value = [mock_row1, mock_row2, mock_row3]
-
-        # Act
-        result = await AnalyticsService.get_activity_details(user_id, mock_db)
-
-        # Assert
-        assert len(result) == 2
-
-        # Check first date
-        day1 = result[0]
-        assert day1['date'] == '2024-10-01'
-        assert day1['LESSON_COMPLETED'] == 3
-        assert day1['QUIZ_ATTEMPT'] == 1
-
-        # Check second date
-        day2 = result[1]
-        assert day2['date'] == '2024-10-02'
-        assert day2['LESSON_COMPLETED'] == 2
-
-        # Verify sorted by date
-        assert result[0]['date'] < result[1]['date']
-
-    async def test_get_activity_details_empty_result(self, mock_db):
-        # Arrange
-        user_id = 1
-        mock_db.execute.return_value.all.return_value = []
-
-        # Act
-        result = await AnalyticsService.get_activity_details(user_id, mock_db)
-
-        # Assert
-        assert result == []
-
-    async def test_get_activity_details_single_activity_type(self, mock_db):
-        # Arrange
-        user_id = 1
-
-        mock_row = MagicMock()
-        mock_row.date = datetime(2024, 10, 1).date()
-        mock_row.activity_type = 'LOGIN'
-        mock_row.count = 5
-
-        mock_db.execute.return_value.all.return_value = [mock_row]
-
-        # Act
-        result = await AnalyticsService.get_activity_details(user_id, mock_db)
-
-        # Assert
-        assert len(result) == 1
-        day = result[0]
-        assert day['date'] == '2024-10-01'
-        assert day['LOGIN'] == 5
-
-    async def test_get_activity_details_multiple_dates(self, mock_db):
-        # Arrange
-        user_id = 1
-
-        # Create mock rows for different dates
-        rows = []
-        dates = [datetime(2024, 9, 30).date(), datetime(2024, 10, 1).date(), datetime(2024, 9, 29).date()]
-
-        for i, date in enumerate(dates):
-            mock_row = MagicMock()
-            mock_row.date = date
-            mock_row.activity_type = 'LESSON_COMPLETED'
-            mock_row.count = i + 1
-            rows.append(mock_row)
-
         mock_db.execute.return_value.all.return_value = rows
 
         # Act
         result = await AnalyticsService.get_activity_details(user_id, mock_db)
 
         # Assert
-        assert len(result) == 3
-
-        # Verify sorted by date
-        assert result[0]['date'] == '2024-09-29'
-        assert result[1]['date'] == '2024-09-30'
-        assert result[2]['date'] == '2024-10-01'
-
-        # Verify counts
-        assert result[0]['LESSON_COMPLETED'] == 3  # Third row
-        assert result[1]['LESSON_COMPLETED'] == 1  # First row
-        assert result[2]['LESSON_COMPLETED'] == 2  # Second row
-
-    async def test_get_activity_details_same_date_different_types(self, mock_db):
-        # Arrange
-        user_id = 1
-
-        mock_row1 = MagicMock()
-        mock_row1.date = datetime(2024, 10, 1).date()
-        mock_row1.activity_type = 'LESSON_COMPLETED'
-        mock_row1.count = 3
-
-        mock_row2 = MagicMock()
-        mock_row2.date = datetime(2024, 10, 1).date()
-        mock_row2.activity_type = 'CODE_EXECUTION'
-        mock_row2.count = 7
-
-        mock_row3 = MagicMock()
-        mock_row3.date = datetime(2024, 10, 1).date()
-        mock_row3.activity_type = 'QUIZ_ATTEMPT'
-        mock_row3.count = 2
-
-        mock_db.execute.return_value.all.return_value = [mock_row1, mock_row2, mock_row3]
-
-        # Act
-        result = await AnalyticsService.get_activity_details(user_id, mock_db)
-
-        # Assert
-        assert len(result) == 1
-        day = result[0]
-        assert day['date'] == '2024-10-01'
-        assert day['LESSON_COMPLETED'] == 3
-        assert day['CODE_EXECUTION'] == 7
-        assert day['QUIZ_ATTEMPT'] == 2
+        assert result == expected
 
     async def test_get_activity_details_query_parameters(self, mock_db):
         # Arrange
         user_id = 1
         mock_db.execute.return_value.all.return_value = []
+        before = datetime.now()
 
         # Act
         await AnalyticsService.get_activity_details(user_id, mock_db)
 
         # Assert
-        # Verify the query was called with correct parameters
-        call_args = mock_db.execute.call_args[0][0]
-        query_str = str(call_args)
+        # Inspect the executed statement directly instead of compiling it to SQL
+        stmt = mock_db.execute.call_args.args[0]
+        user_filter, since_filter = stmt.whereclause.clauses
 
         # Check that the query filters by user_id
-        assert 'user_activity_logs.user_id' in query_str
+        assert user_filter.compare(UserActivityLog.user_id == user_id)
 
         # Check that the query filters by timestamp (one year ago)
-        assert 'user_activity_logs.timestamp >=' in query_str
-
-        # Check grouping
-        assert 'GROUP BY' in query_str
+        assert since_filter.left.compare(UserActivityLog.timestamp.expression)
+        assert since_filter.operator is operators.ge
+        assert before - timedelta(days=365) <= since_filter.right.value <= datetime.now() - timedelta(days=365)
+
+        # Check grouping by day and activity type
+        date_group, type_group = stmt._group_by_clauses
+        assert date_group.clauses[0].element.compare(func.date(UserActivityLog.timestamp))
+        assert type_group.compare(UserActivityLog.activity_type.expression)
 
     async def test_track_activity_success(self, mock_db):
         # Arrange
@@ -1,272 +1,228 @@
 import pytest
 from unittest.mock import AsyncMock
 from src.services.content_scanner_service import ContentScannerService
-from src.services.file_system_service import DirectoryScanResult
+from src.services.file_system_service import DirectoryScanResult, FileSystemService
 from src.schemas.content_node import ContentNode
 
 
-pytestmark = pytest.mark.asyncio
-
-
-class TestContentScannerService:
-    async def test_build_content_tree_with_mock_directory_structure(self, mocker):
-        # Mock FileSystemService
-        mock_fs_service = mocker.AsyncMock()
-
-        # Mock scanDirectory for 'courses' directory
-        mock_fs_service.scan_directory.side_effect = self._mock_scan_directory
-
-        # Mock readFile for config files
-        mock_fs_service.read_file.side_effect = self._mock_read_file
-
-        # Create service instance
-        service = ContentScannerService(mock_fs_service)
-
-        # Call build_content_tree
-        result = await service.build_content_tree()
-
-        # Expected structure
-        expected = [
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+# Directory listings for the mocked content tree, built once at import.
+_FS_TREE = {
+    'courses': (
+        DirectoryScanResult(name='course1', type='directory', path='courses/course1'),
+        DirectoryScanResult(name='course2', type='directory', path='courses/course2'),
+        DirectoryScanResult(name='other_dir', type='directory', path='courses/other_dir'),  # No config, should be ignored
+    ),
+    'courses/course1': (
+        DirectoryScanResult(name='_course.yml', type='file', path='courses/course1/_course.yml'),
+        DirectoryScanResult(name='module1', type='directory', path='courses/course1/module1'),
+        DirectoryScanResult(name='module2', type='directory', path='courses/course1/module2'),
+    ),
+    'courses/course1/module1': (
+        DirectoryScanResult(name='_module.yml', type='file', path='courses/course1/module1/_module.yml'),
+        DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/course1/module1/lesson1.lesson'),
+        DirectoryScanResult(name='lesson2.lesson', type='file', path='courses/course1/module1/lesson2.lesson'),
+    ),
+    'courses/course1/module2': (
+        DirectoryScanResult(name='_module.yml', type='file', path='courses/course1/module2/_module.yml'),
+        DirectoryScanResult(name='lesson3.lesson', type='file', path='courses/course1/module2/lesson3.lesson'),
+    ),
+    'courses/course2': (
+        DirectoryScanResult(name='_course.yml', type='file', path='courses/course2/_course.yml'),
+        DirectoryScanResult(name='lesson4.lesson', type='file', path='courses/course2/lesson4.lesson'),
+    ),
+    'courses/other_dir': (
+        DirectoryScanResult(name='some_file.txt', type='file', path='courses/other_dir/some_file.txt'),
+    ),
+}
+
+_FILES = {
+    'courses/course1/_course.yml': 'title: Course 1\n',
+    'courses/course1/module1/_module.yml': 'title: Module 1\n',
+    'courses/course1/module2/_module.yml': 'title: Module 2\n',
+    'courses/course2/_course.yml': 'title: Course 2\n',
+}
+
+
+# The tree build_content_tree should produce from _FS_TREE and _FILES.
+_EXPECTED_TREE = [
+    ContentNode(
+        type='course',
+        name='Course 1',
+        path='courses/course1',
+        config_path='courses/course1/_course.yml',
+        children=[
             ContentNode(
-                type='course',
-                name='Course 1',
-                path='courses/course1',
-                config_path='courses/course1/_course.yml',
+                type='module',
+                name='Module 1',
+                path='courses/course1/module1',
+                config_path='courses/course1/module1/_module.yml',
                 children=[
                     ContentNode(
-                        type='module',
-                        name='Module 1',
-                        path='courses/course1/module1',
-                        config_path='courses/course1/module1/_module.yml',
-                        children=[
-                            ContentNode(
-                                type='lesson',
-                                name='lesson1',
-                                path='courses/course1/module1/lesson1.lesson'
-                            ),
-                            ContentNode(
-                                type='lesson',
-                                name='lesson2',
-                                path='courses/course1/module1/lesson2.lesson'
-                            )
-                        ]
+                        type='lesson',
+                        name='lesson1',
+                        path='courses/course1/module1/lesson1.lesson'
                     ),
                     ContentNode(
-                        type='module',
-                        name='Module 2',
-                        path='courses/course1/module2',
-                        config_path='courses/course1/module2/_module.yml',
-                        children=[
-                            ContentNode(
-                                type='lesson',
-                                name='lesson3',
-                                path='courses/course1/module2/lesson3.lesson'
-                            )
-                        ]
+                        type='lesson',
+                        name='lesson2',
+                        path='courses/course1/module1/lesson2.lesson'
                     )
                 ]
             ),
             ContentNode(
-                type='course',
-                name='Course 2',
-                path='courses/course2',
-                config_path='courses/course2/_course.yml',
+                type='module',
+                name='Module 2',
+                path='courses/course1/module2',
+                config_path='courses/course1/module2/_module.yml',
                 children=[
                     ContentNode(
                         type='lesson',
-                        name='lesson4',
-                        path='courses/course2/lesson4.lesson'
+                        name='lesson3',
+                        path='courses/course1/module2/lesson3.lesson'
                     )
                 ]
             )
         ]
-
-        # Assert the result matches expected
-        assert len(result) == 2
-        assert result[0].type == 'course'
-        assert result[0].name == 'Course 1'
-        assert result[0].path == 'courses/course1'
-        assert result[0].config_path == 'courses/course1/_course.yml'
-        assert len(result[0].children) == 2
-
-        # Module 1
-        module1 = result[0].children[0]
-        assert module1.type == 'module'
-        assert module1.name == 'Module 1'
-        assert len(module1.children) == 2
-        assert module1.children[0].name == 'lesson1'
-        assert module1.children[1].name == 'lesson2'
-
-        # Module 2
-        module2 = result[0].children[1]
-        assert module2.type == 'module'
-        assert module2.name == 'Module 2'
-        assert len(module2.children) == 1
-        assert module2.children[0].name == 'lesson3'
-
-        # Course 2
-        course2 = result[1]
-        assert course2.type == 'course'
-        assert course2.name == 'Course 2'
-        assert len(course2.children) == 1
-        assert course2.children[0].name == 'lesson4'
-
-    def _mock_scan_directory(self, path):
-        if path == 'courses':
-            return [
-                DirectoryScanResult(name='course1', type='directory', path='courses/course1'),
-                DirectoryScanResult(name='course2', type='directory', path='courses/course2'),
-                DirectoryScanResult(name='other_dir', type='directory', path='courses/other_dir'),  # No config, should be ignored
-            ]
-        elif path == 'courses/course1':
-            return [
-                DirectoryScanResult(name='_course.yml', type='file', path='courses/course1/_course.yml'),
-                DirectoryScanResult(name='module1', type='directory', path='courses/course1/module1'),
-                DirectoryScanResult(name='module2', type='directory', path='courses/course1/module2'),
-            ]
-        elif path == 'courses/course1/module1':
-            return [
-                DirectoryScanResult(name='_module.yml', type='file', path='courses/course1/module1/_module.yml'),
-                DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/course1/module1/lesson1.lesson'),
-                DirectoryScanResult(name='lesson2.lesson', type='file', path='courses/course1/module1/lesson2.lesson'),
-            ]
-        elif path == 'courses/course1/module2':
-            return [
-                DirectoryScanResult(name='_module.yml', type='file', path='courses/course1/module2/_module.yml'),
-                DirectoryScanResult(name='lesson3.lesson', type='file', path='courses/course1/module2/lesson3.lesson'),
-            ]
-        elif path == 'courses/course2':
-            return [
-                DirectoryScanResult(name='_course.yml', type='file', path='courses/course2/_course.yml'),
-                DirectoryScanResult(name='lesson4.lesson', type='file', path='courses/course2/lesson4.lesson'),
-            ]
-        elif path == 'courses/other_dir':
-            return [
-                DirectoryScanResult(name='some_file.txt', type='file', path='courses/other_dir/some_file.txt'),
-            ]
-        return []
-
-    def _mock_read_file(self, path):
-        if path == 'courses/course1/_course.yml':
-            return 'title: Course 1\n'
-        elif path == 'courses/course1/module1/_module.yml':
-            return 'title: Module 1\n'
-        elif path == 'courses/course1/module2/_module.yml':
-            return 'title: Module 2\n'
-        elif path == 'courses/course2/_course.yml':
-            return 'title: Course 2\n'
-        return ''
-
-    async def test_build_node_course_with_valid_config(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-            DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/test_course/lesson1.lesson'),
+    ),
+    ContentNode(
+        type='course',
+        name='Course 2',
+        path='courses/course2',
+        config_path='courses/course2/_course.yml',
+        children=[
+            ContentNode(
+                type='lesson',
+                name='lesson4',
+                path='courses/course2/lesson4.lesson'
+            )
         ]
-        mock_fs.read_file.return_value = 'title: Test Course\n'
+    )
+]
 
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/test_course')
 
-        assert result is not None
-        assert result.type == 'course'
-        assert result.name == 'Test Course'
-        assert result.path == 'courses/test_course'
-        assert result.config_path == 'courses/test_course/_course.yml'
-        assert len(result.children) == 1
-        assert result.children[0].type == 'lesson'
-        assert result.children[0].name == 'lesson1'
+# Scan entries shared by the single-node tests.
+_COURSE_YML = DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml')
+_COURSE_LESSON1 = DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/test_course/lesson1.lesson')
+_COURSE_MODULE1 = DirectoryScanResult(name='module1', type='directory', path='courses/test_course/module1')
+_COURSE_MODULE1_YML = DirectoryScanResult(name='_module.yml', type='file', path='courses/test_course/module1/_module.yml')
+_MODULE_YML = DirectoryScanResult(name='_module.yml', type='file', path='courses/course/module/_module.yml')
 
-    async def test_build_node_course_with_invalid_yaml(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-        ]
-        mock_fs.read_file.return_value = 'invalid: yaml: content:'
 
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/test_course')
+class _FakeFS:
+    """FileSystemService stand-in serving ``_FS_TREE`` listings and ``_FILES`` contents."""
 
-        assert result is not None
-        assert result.type == 'course'
-        assert result.name == 'test_course'  # Falls back to path basename
-        assert result.path == 'courses/test_course'
-        assert result.config_path == 'courses/test_course/_course.yml'
-        assert len(result.children) == 0
-
-    async def test_build_node_course_with_missing_title(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-        ]
-        mock_fs.read_file.return_value = 'other_field: value\n'
+    async def scan_directory(self, path):
+        return list(_FS_TREE.get(path, ()))
 
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/test_course')
+    async def read_file(self, path):
+        return _FILES.get(path, '')
 
-        assert result is not None
-        assert result.type == 'course'
-        assert result.name == 'test_course'  # Falls back to path basename
-        assert result.path == 'courses/test_course'
-        assert result.config_path == 'courses/test_course/_course.yml'
-        assert len(result.children) == 0
 
-    async def test_build_node_module_with_valid_config(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_module.yml', type='file', path='courses/course/module/_module.yml'),
-            DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/course/module/lesson1.lesson'),
-        ]
-        mock_fs.read_file.return_value = 'title: Test Module\n'
+class TestContentScannerService:
+    @pytest.fixture(scope="class")
+    def mock_fs(self):
+        """FileSystemService mock shared by the class; reset before every test.
 
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/course/module')
+        The scanner awaits ``scan_directory`` and ``read_file``, so this must stay an
+        ``AsyncMock``; plain ``return_value`` and sync ``side_effect`` values are fine.
+        """
+        return AsyncMock(spec_set=FileSystemService)
 
-        assert result is not None
-        assert result.type == 'module'
-        assert result.name == 'Test Module'
-        assert result.path == 'courses/course/module'
-        assert result.config_path == 'courses/course/module/_module.yml'
-        assert len(result.children) == 1
-        assert result.children[0].type == 'lesson'
-        assert result.children[0].name == 'lesson1'
+    @pytest.fixture(autouse=True)
+    def reset_mock_fs(self, mock_fs):
+        mock_fs.reset_mock(return_value=True, side_effect=True)
 
-    async def test_build_node_module_with_invalid_yaml(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_module.yml', type='file', path='courses/course/module/_module.yml'),
-        ]
-        mock_fs.read_file.return_value = 'invalid yaml content'
+    async def test_build_content_tree_with_mock_directory_structure(self):
+        # Create service instance over the fake content tree
+        service = ContentScannerService(_FakeFS())
 
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/course/module')
+        # Call build_content_tree
+        result = await service.build_content_tree()
 
-        assert result is not None
-        assert result.type == 'module'
-        assert result.name == 'module'  # Falls back to path basename
-        assert result.path == 'courses/course/module'
-        assert result.config_path == 'courses/course/module/_module.yml'
-        assert len(result.children) == 0
-
-    async def test_build_node_module_with_missing_title(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_module.yml', type='file', path='courses/course/module/_module.yml'),
-        ]
-        mock_fs.read_file.return_value = 'description: Some description\n'
+        # Assert the result matches expected
+        assert result == _EXPECTED_TREE
+
+    @pytest.mark.parametrize(
+        "node_path, listing, content, expected_type, expected_name, expected_lessons",
+        [
+            pytest.param(
+                'courses/test_course',
+                [_COURSE_YML, _COURSE_LESSON1],
+                'title: Test Course\n',
+                'course', 'Test Course', ['lesson1'],
+                id="course_with_valid_config",
+            ),
+            pytest.param(
+                'courses/test_course',
+                [_COURSE_YML],
+                'invalid: yaml: content:',
+                'course', 'test_course', [],  # Falls back to path basename
+                id="course_with_invalid_yaml",
+            ),
+            pytest.param(
+                'courses/test_course',
+                [_COURSE_YML],
+                'other_field: value\n',
+                'course', 'test_course', [],
+                id="course_with_missing_title",
+            ),
+            pytest.param(
+                'courses/course/module',
+                [
+                    _MODULE_YML,
+                    DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/course/module/lesson1.lesson'),
+                ],
+                'title: Test Module\n',
+                'module', 'Test Module', ['lesson1'],
+                id="module_with_valid_config",
+            ),
+            pytest.param(
+                'courses/course/module',
+                [_MODULE_YML],
+                'invalid yaml content',
+                'module', 'module', [],
+                id="module_with_invalid_yaml",
+            ),
+            pytest.param(
+                'courses/course/module',
+                [_MODULE_YML],
+                'description: Some description\n',
+                'module', 'module', [],
+                id="module_with_missing_title",
+            ),
+            pytest.param(
+                'courses/test_course',
+                [_COURSE_YML],
+                Exception("File read error"),
+                'course', 'test_course', [],
+                id="file_read_error",
+            ),
+        ],
+    )
+    async def test_build_node_config(
+        self, mock_fs, node_path, listing, content, expected_type, expected_name, expected_lessons
+    ):
+        mock_fs.scan_directory.return_value = listing
+        if isinstance(content, Exception):
+            mock_fs.read_file.side_effect = content
+        else:
+            mock_fs.read_file.return_value = content
 
         service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/course/module')
+        result = await service._build_node(node_path)
 
         assert result is not None
-        assert result.type == 'module'
-        assert result.name == 'module'  # Falls back to path basename
-        assert result.path == 'courses/course/module'
-        assert result.config_path == 'courses/course/module/_module.yml'
-        assert len(result.children) == 0
-
-    async def test_build_node_directory_without_config(self, mocker):
-        mock_fs = mocker.AsyncMock()
+        assert result.type == expected_type
+        assert result.name == expected_name
+        assert result.path == node_path
+        assert result.config_path == listing[0].path
+        assert [child.name for child in result.children] == expected_lessons
+        assert all(child.type == 'lesson' for child in result.children)
+
+    async def test_build_node_directory_without_config(self, mock_fs):
         mock_fs.scan_directory.return_value = [
             DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/no_config/lesson1.lesson'),
             DirectoryScanResult(name='other_file.txt', type='file', path='courses/no_config/other_file.txt'),
@@ -277,21 +233,17 @@ class TestContentScannerService:
 
         assert result is None
 
-    async def test_build_node_with_child_directories_recursive(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.side_effect = lambda path: {
-            'courses/test_course': [
-                DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-                DirectoryScanResult(name='module1', type='directory', path='courses/test_course/module1'),
-            ],
-            'courses/test_course/module1': [
-                DirectoryScanResult(name='_module.yml', type='file', path='courses/test_course/module1/_module.yml'),
-            ]
-        }.get(path, [])
-        mock_fs.read_file.side_effect = lambda path: {
+    async def test_build_node_with_child_directories_recursive(self, mock_fs):
+        listings = {
+            'courses/test_course': [_COURSE_YML, _COURSE_MODULE1],
+            'courses/test_course/module1': [_COURSE_MODULE1_YML],
+        }
+        files = {
             'courses/test_course/_course.yml': 'title: Test Course\n',
             'courses/test_course/module1/_module.yml': 'title: Module 1\n'
-        }.get(path, '')
+        }
+        mock_fs.scan_directory.side_effect = lambda path: listings.get(path, [])
+        mock_fs.read_file.side_effect = lambda path: files.get(path, '')
 
         service = ContentScannerService(mock_fs)
         result = await service._build_node('courses/test_course')
@@ -305,11 +257,10 @@ class TestContentScannerService:
         assert child.name == 'Module 1'
         assert len(child.children) == 0
 
-    async def test_build_node_with_lesson_files(self, mocker):
-        mock_fs = mocker.AsyncMock()
+    async def test_build_node_with_lesson_files(self, mock_fs):
         mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-            DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/test_course/lesson1.lesson'),
+            _COURSE_YML,
+            _COURSE_LESSON1,
             DirectoryScanResult(name='lesson2.lesson', type='file', path='courses/test_course/lesson2.lesson'),
         ]
         mock_fs.read_file.return_value = 'title: Test Course\n'
@@ -322,23 +273,20 @@ class TestContentScannerService:
         assert all(child.type == 'lesson' for child in result.children)
         assert {child.name for child in result.children} == {'lesson1', 'lesson2'}
 
-    async def test_build_node_mixed_content(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.side_effect = lambda path: {
-            'courses/test_course': [
-                DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-                DirectoryScanResult(name='module1', type='directory', path='courses/test_course/module1'),
-                DirectoryScanResult(name='lesson1.lesson', type='file', path='courses/test_course/lesson1.lesson'),
-            ],
+    async def test_build_node_mixed_content(self, mock_fs):
+        listings = {
+            'courses/test_course': [_COURSE_YML, _COURSE_MODULE1, _COURSE_LESSON1],
             'courses/test_course/module1': [
-                DirectoryScanResult(name='_module.yml', type='file', path='courses/test_course/module1/_module.yml'),
+                _COURSE_MODULE1_YML,
                 DirectoryScanResult(name='lesson2.lesson', type='file', path='courses/test_course/module1/lesson2.lesson'),
             ]
-        }.get(path, [])
-        mock_fs.read_file.side_effect = lambda path: {
+        }
+        files = {
             'courses/test_course/_course.yml': 'title: Test Course\n',
             'courses/test_course/module1/_module.yml': 'title: Module 1\n'
-        }.get(path, '')
+        }
+        mock_fs.scan_directory.side_effect = lambda path: listings.get(path, [])
+        mock_fs.read_file.side_effect = lambda path: files.get(path, '')
 
         service = ContentScannerService(mock_fs)
         result = await service._build_node('courses/test_course')
@@ -353,20 +301,3 @@ class TestContentScannerService:
         assert len(module_child.children) == 1
         assert module_child.children[0].name == 'lesson2'
         assert lesson_child.name == 'lesson1'
-
-    async def test_build_node_file_read_error(self, mocker):
-        mock_fs = mocker.AsyncMock()
-        mock_fs.scan_directory.return_value = [
-            DirectoryScanResult(name='_course.yml', type='file', path='courses/test_course/_course.yml'),
-        ]
-        mock_fs.read_file.side_effect = Exception("File read error")
-
-        service = ContentScannerService(mock_fs)
-        result = await service._build_node('courses/test_course')
-
-        assert result is not None
-        assert result.type == 'course'
-        assert result.name == 'test_course'  # Falls back to path basename
-        assert result.path == 'courses/test_course'
-        assert result.config_path == 'courses/test_course/_course.yml'
-        assert len(result.children) == 0
\ No newline at end of file
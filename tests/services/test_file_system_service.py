@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import Path
 
 import pytest
@@ -93,9 +92,9 @@ async def test_rename_item(fs_service):
     assert await service.read_file("new.txt") == "content"
 
 
-async def test_security_access_denied_for_path_traversal(fs_service):
-    service, _ = fs_service
-    traversal_paths = [
+@pytest.mark.parametrize(
+    "method_name, args",
+    [
         ("read_file", ("../../../etc/passwd",)),
         ("write_file", ("../../../etc/passwd", "content")),
         ("create_directory", ("../../../etc/newdir",)),
@@ -103,11 +102,10 @@ async def test_security_access_denied_for_path_traversal(fs_service):
         ("rename_item", ("../../../etc/passwd", "newname")),
         ("path_exists", ("../../../etc/passwd",)),
         ("scan_directory", ("../../../etc",)),
-    ]
-
-    for method_name, args in traversal_paths:
-        method = getattr(service, method_name)
-        with pytest.raises(SecurityError):
-            result = method(*args)
-            if asyncio.iscoroutine(result):
-                await result
+    ],
+    ids=lambda value: value if isinstance(value, str) else None,
+)
+async def test_security_access_denied_for_path_traversal(fs_service, method_name, args):
+    service, _ = fs_service
+    with pytest.raises(SecurityError):
+        await getattr(service, method_name)(*args)
@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
+from types import SimpleNamespace
 from datetime import datetime
 from src.services.progress_service import ProgressService
 from src.models.user_lesson_progress import UserLessonProgress
@@ -7,18 +8,24 @@ from src.models.user_activity_log import UserActivityLog
 from src.services.content_scanner_service import ContentScannerService
 
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class TestProgressService:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_db(self):
         return AsyncMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_content_service(self):
         return AsyncMock(spec=ContentScannerService)
 
+    @pytest.fixture(autouse=True)
+    def reset_mocks(self, mock_db, mock_content_service):
+        """Clear calls and configured results left on the shared mocks."""
+        mock_db.reset_mock(return_value=True, side_effect=True)
+        mock_content_service.reset_mock(return_value=True, side_effect=True)
+
     async def test_mark_lesson_as_complete_new_progress(self, mock_db):
         # Arrange
         user_id = 1
@@ -36,8 +43,9 @@ class TestProgressService:
         assert mock_db.add.call_count == 2  # Progress and ActivityLog
         mock_db.commit.assert_called_once()
 
+        progress_call, activity_call = (c.args[0] for c in mock_db.add.call_args_list)
+
         # Check UserLessonProgress creation
-        progress_call = mock_db.add.call_args_list[0][0][0]
         assert isinstance(progress_call, UserLessonProgress)
         assert progress_call.user_id == user_id
         assert progress_call.course_slug == course_slug
@@ -45,7 +53,6 @@ class TestProgressService:
         assert isinstance(progress_call.completion_date, datetime)
 
         # Check UserActivityLog creation
-        activity_call = mock_db.add.call_args_list[1][0][0]
         assert isinstance(activity_call, UserActivityLog)
         assert activity_call.user_id == user_id
         assert activity_call.activity_type == 'LESSON_COMPLETED'
@@ -58,8 +65,7 @@ class TestProgressService:
         lesson_slug = "functions"
 
         # Mock existing progress
-        existing_progress = MagicMock(spec=UserLessonProgress)
-        existing_progress.completion_date = datetime(2023, 1, 1)
+        existing_progress = SimpleNamespace(completion_date=datetime(2023, 1, 1))
         mock_db.execute.return_value.scalar_one_or_none.return_value = existing_progress
 
         # Act
@@ -74,7 +80,7 @@ class TestProgressService:
         assert existing_progress.completion_date != datetime(2023, 1, 1)
 
         # Check UserActivityLog creation
-        activity_call = mock_db.add.call_args_list[0][0][0]
+        (activity_call,) = (c.args[0] for c in mock_db.add.call_args_list)
         assert isinstance(activity_call, UserActivityLog)
         assert activity_call.user_id == user_id
         assert activity_call.activity_type == 'LESSON_COMPLETED'
@@ -90,8 +96,7 @@ class TestProgressService:
         mock_content_service.get_course_lesson_slugs.return_value = lesson_slugs
 
         # Mock completed lessons
-        mock_result = MagicMock()
-        mock_result.lesson_slug = "functions"
+        mock_result = SimpleNamespace(lesson_slug="functions")
         mock_db.execute.return_value = [mock_result]  # One completed lesson
 
         # Act
@@ -115,8 +120,8 @@ class TestProgressService:
 
         # Mock completed lessons
         mock_results = [
-            MagicMock(lesson_slug="functions"),
-            MagicMock(lesson_slug="loops")
+            SimpleNamespace(lesson_slug="functions"),
+            SimpleNamespace(lesson_slug="loops")
         ]
         mock_db.execute.return_value = mock_results
 
@@ -179,8 +184,8 @@ class TestProgressService:
 
         # Mock completed lessons
         mock_results = [
-            MagicMock(lesson_slug="functions"),
-            MagicMock(lesson_slug="classes")
+            SimpleNamespace(lesson_slug="functions"),
+            SimpleNamespace(lesson_slug="classes")
         ]
         mock_db.execute.return_value = mock_results
 
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.services.session_service import SessionService
@@ -9,23 +9,32 @@ from src.models.user_session import UserSession
 from src.core.errors import DatabaseError, ValidationError
 
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+SESSION_ID = UUID("33333333-3333-3333-3333-333333333333")
+SESSION_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+SESSION_EXPIRES_AT = datetime(2099, 1, 1)
 
 
 class TestSessionService:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_db(self):
         return AsyncMock()
 
+    @pytest.fixture(autouse=True)
+    def reset_mock_db(self, mock_db):
+        """Clear calls and configured results left on the shared session mock."""
+        mock_db.reset_mock(return_value=True, side_effect=True)
+
     @pytest.fixture
     def sample_session(self):
         session = MagicMock(spec=UserSession)
-        session.id = uuid4()
-        session.user_id = uuid4()
+        session.id = SESSION_ID
+        session.user_id = SESSION_USER_ID
         session.refresh_token_hash = "hashed_token"
         session.device_info = "Chrome"
         session.ip_address = "127.0.0.1"
-        session.expires_at = datetime.utcnow() + timedelta(days=7)
+        session.expires_at = SESSION_EXPIRES_AT
         session.is_active = True
         return session
 
@@ -89,32 +98,17 @@ class TestSessionService:
         with pytest.raises(ValidationError, match="Refresh token is required"):
             await SessionService.create_session(mock_db, user_id, refresh_token)
 
-    async def test_create_session_database_error(self, mock_db):
-        # Arrange
-        user_id = uuid4()
-        refresh_token = "test_token"
-        mock_db.add.return_value = None
-        mock_db.commit.side_effect = SQLAlchemyError("DB error")
-
-        # Act & Assert
-        with pytest.raises(DatabaseError, match="Failed to create session"):
-            await SessionService.create_session(mock_db, user_id, refresh_token)
-        mock_db.rollback.assert_called_once()
-
     async def test_get_session_by_token_hash_found_active(self, mock_db, sample_session):
         # Arrange
         token_hash = "hashed_token"
         mock_db.execute.return_value.scalar_one_or_none.return_value = sample_session
 
-        with patch('src.services.session_service.datetime') as mock_datetime:
-            mock_datetime.utcnow.return_value = datetime.utcnow() - timedelta(hours=1)  # Before expiry
-
-            # Act
-            result = await SessionService.get_session_by_token_hash(mock_db, token_hash)
+        # Act
+        result = await SessionService.get_session_by_token_hash(mock_db, token_hash)
 
-            # Assert
-            assert result == sample_session
-            mock_db.execute.assert_called_once()
+        # Assert
+        assert result == sample_session
+        mock_db.execute.assert_called_once()
 
     async def test_get_session_by_token_hash_not_found(self, mock_db):
         # Arrange
@@ -154,15 +148,6 @@ class TestSessionService:
         assert result is None
         mock_db.execute.assert_called_once()
 
-    async def test_get_session_by_token_hash_database_error(self, mock_db):
-        # Arrange
-        token_hash = "hashed_token"
-        mock_db.execute.side_effect = SQLAlchemyError("DB error")
-
-        # Act & Assert
-        with pytest.raises(DatabaseError, match="Failed to lookup session"):
-            await SessionService.get_session_by_token_hash(mock_db, token_hash)
-
     async def test_invalidate_session_success(self, mock_db):
         # Arrange
         session_id = uuid4()
@@ -189,16 +174,6 @@ class TestSessionService:
         mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
 
-    async def test_invalidate_session_database_error(self, mock_db):
-        # Arrange
-        session_id = uuid4()
-        mock_db.execute.side_effect = SQLAlchemyError("DB error")
-
-        # Act & Assert
-        with pytest.raises(DatabaseError, match="Failed to invalidate session"):
-            await SessionService.invalidate_session(mock_db, session_id)
-        mock_db.rollback.assert_called_once()
-
     async def test_invalidate_user_sessions_success(self, mock_db):
         # Arrange
         user_id = uuid4()
@@ -212,16 +187,6 @@ class TestSessionService:
         mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
 
-    async def test_invalidate_user_sessions_database_error(self, mock_db):
-        # Arrange
-        user_id = uuid4()
-        mock_db.execute.side_effect = SQLAlchemyError("DB error")
-
-        # Act & Assert
-        with pytest.raises(DatabaseError, match="Failed to invalidate user sessions"):
-            await SessionService.invalidate_user_sessions(mock_db, user_id)
-        mock_db.rollback.assert_called_once()
-
     async def test_cleanup_expired_sessions_success(self, mock_db):
         # Arrange
         mock_db.execute.return_value.rowcount = 5
@@ -234,11 +199,37 @@ class TestSessionService:
         mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
 
-    async def test_cleanup_expired_sessions_database_error(self, mock_db):
+    @pytest.mark.parametrize(
+        "method_name, args, message, expect_rollback",
+        [
+            pytest.param(
+                "create_session", (SESSION_USER_ID, "test_token"), "Failed to create session", True,
+                id="create_session",
+            ),
+            pytest.param(
+                "get_session_by_token_hash", ("hashed_token",), "Failed to lookup session", False,
+                id="get_session_by_token_hash",
+            ),
+            pytest.param(
+                "invalidate_session", (SESSION_ID,), "Failed to invalidate session", True,
+                id="invalidate_session",
+            ),
+            pytest.param(
+                "invalidate_user_sessions", (SESSION_USER_ID,), "Failed to invalidate user sessions", True,
+                id="invalidate_user_sessions",
+            ),
+            pytest.param(
+                "cleanup_expired_sessions", (), "Failed to cleanup expired sessions", True,
+                id="cleanup_expired_sessions",
+            ),
+        ],
+    )
+    async def test_database_error(self, mock_db, method_name, args, message, expect_rollback):
         # Arrange
         mock_db.execute.side_effect = SQLAlchemyError("DB error")
+        mock_db.commit.side_effect = SQLAlchemyError("DB error")
 
         # Act & Assert
-        with pytest.raises(DatabaseError, match="Failed to cleanup expired sessions"):
-            await SessionService.cleanup_expired_sessions(mock_db)
-        mock_db.rollback.assert_called_once()
+        with pytest.raises(DatabaseError, match=message):
+            await getattr(SessionService, method_name)(mock_db, *args)
+        assert mock_db.rollback.call_count == (1 if expect_rollback else 0)
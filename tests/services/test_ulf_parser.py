@@ -1,11 +1,8 @@
 from pathlib import Path
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-
-from src.services.ulf_parser import ULFParseError, parse_lesson_file
+from src.services.ulf_parser import ULFParseError, parse_lesson_file, parse_lesson_file_from_text
 
 
 def make_lesson(tmp_path: Path, text: str) -> Path:
@@ -51,17 +48,13 @@ What is ULF?
     assert lesson.cells[1].metadata == {"question_id": "q1"}
 
 
-def test_parse_lesson_invalid_front_matter(tmp_path):
-    file_path = make_lesson(tmp_path, "---\nnot yaml")
-
+def test_parse_lesson_invalid_front_matter():
     with pytest.raises(ULFParseError):
-        parse_lesson_file(file_path)
+        parse_lesson_file_from_text("---\nnot yaml")
 
 
-def test_parse_lesson_missing_cell_type(tmp_path):
-    file_path = make_lesson(
-        tmp_path,
-        """
+def test_parse_lesson_missing_cell_type():
+    text = """
 ---
 title: Bad Lesson
 slug: bad-lesson
@@ -69,8 +62,7 @@ slug: bad-lesson
 foo: bar
 ---
 content
-""",
-    )
+"""
 
     with pytest.raises(ULFParseError):
-        parse_lesson_file(file_path)
+        parse_lesson_file_from_text(text.strip())
@@ -1,8 +1,4 @@
 import pytest
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from src.services.ulf_parser_service import ULFParserService
 from src.core.errors import ParsingError
@@ -80,9 +76,11 @@ Question?
         assert reparsed['cells'][i]['content'] == cell['content']
 
 
-def test_parse_invalid_yaml_raises_parsing_error():
-    """Test that invalid YAML in frontmatter raises ParsingError."""
-    invalid_ulf_text = """---
+@pytest.mark.parametrize(
+    "invalid_ulf_text",
+    [
+        pytest.param(
+            """---
 title: Test Lesson
 invalid yaml here: [unclosed
 slug: test-lesson
@@ -90,15 +88,11 @@ slug: test-lesson
 type: markdown
 ---
 Content
-"""
-
-    with pytest.raises(ParsingError):
-        ULFParserService.parse(invalid_ulf_text)
-
-
-def test_parse_invalid_cell_config_yaml_raises_parsing_error():
-    """Test that invalid YAML in cell config raises ParsingError."""
-    invalid_ulf_text = """---
+""",
+            id="frontmatter",
+        ),
+        pytest.param(
+            """---
 title: Test Lesson
 slug: test-lesson
 ---
@@ -106,7 +100,12 @@ type: markdown
 invalid: [unclosed
 ---
 Content
-"""
-
+""",
+            id="cell_config",
+        ),
+    ],
+)
+def test_parse_invalid_yaml_raises_parsing_error(invalid_ulf_text):
+    """Test that invalid YAML in the frontmatter or a cell config raises ParsingError."""
     with pytest.raises(ParsingError):
-        ULFParserService.parse(invalid_ulf_text)
\ No newline at end of file
+        ULFParserService.parse(invalid_ulf_text)
@@ -1,30 +1,38 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
+from types import SimpleNamespace
 from sqlalchemy.exc import IntegrityError
 from src.services.user_service import UserService, UserNotFoundException, IncorrectPasswordException
-from src.models.user import User
 from src.schemas.user import UserCreate
 from src.schemas import UserFilter
 
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Hashing is deliberately slow, so the sample user's password is hashed once at import.
+HASHED_PASSWORD = UserService.hash_password("password123")
 
 
 class TestUserService:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_db(self):
         return AsyncMock()
 
+    @pytest.fixture(autouse=True)
+    def reset_mock_db(self, mock_db):
+        """Clear calls and configured results left on the shared session mock."""
+        mock_db.reset_mock(return_value=True, side_effect=True)
+
     @pytest.fixture
     def sample_user(self):
-        user = MagicMock(spec=User)
-        user.id = 1
-        user.email = "test@example.com"
-        user.full_name = "Test User"
-        user.hashed_password = UserService.hash_password("password123")
-        user.role = "STUDENT"
-        user.status = "ACTIVE"
-        return user
+        return SimpleNamespace(
+            id=1,
+            email="test@example.com",
+            full_name="Test User",
+            hashed_password=HASHED_PASSWORD,
+            role="STUDENT",
+            status="ACTIVE",
+        )
 
     async def test_get_user_by_email_found(self, mock_db, sample_user):
         # Arrange
@@ -55,15 +63,6 @@ class TestUserService:
         mock_db.commit.return_value = None
         mock_db.refresh.return_value = None
 
-        # Mock the created user
-        created_user = MagicMock(spec=User)
-        created_user.id = 1
-        created_user.email = "test@example.com"
-        created_user.full_name = "Test User"
-        created_user.hashed_password = "hashed_password"
-        created_user.role = "STUDENT"
-        created_user.status = "ACTIVE"
-
         # Act
         result = await UserService.create_user(user_data, mock_db)
 
@@ -116,84 +115,30 @@ class TestUserService:
         # Assert
         assert result is None
 
-    async def test_list_users_no_filters(self, mock_db, sample_user):
+    @pytest.mark.parametrize(
+        "filter_kwargs",
+        [
+            pytest.param({}, id="no_filters"),
+            pytest.param({"search": "Test"}, id="with_search"),
+            pytest.param({"role": "STUDENT"}, id="with_role_filter"),
+            pytest.param({"status": "ACTIVE"}, id="with_status_filter"),
+            pytest.param({"sort_by": "email", "sort_order": "desc"}, id="with_sorting_desc"),
+            pytest.param({"sort_by": "full_name", "sort_order": "asc"}, id="with_sorting_asc"),
+            pytest.param({"skip": 10, "limit": 5}, id="with_pagination"),
+            pytest.param({"sort_by": "invalid_field"}, id="invalid_sort_by"),
+        ],
+    )
+    async def test_list_users(self, mock_db, sample_user, filter_kwargs):
         # Arrange
         mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
 
         # Act
-        result = await UserService.list_users(mock_db, UserFilter())
+        result = await UserService.list_users(mock_db, UserFilter(**filter_kwargs))
 
         # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
+        assert result == [sample_user]
         mock_db.execute.assert_called_once()
 
-    async def test_list_users_with_search(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(search="Test"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
-    async def test_list_users_with_role_filter(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(role="STUDENT"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
-    async def test_list_users_with_status_filter(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(status="ACTIVE"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
-    async def test_list_users_with_sorting_desc(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(sort_by="email", sort_order="desc"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
-    async def test_list_users_with_sorting_asc(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(sort_by="full_name", sort_order="asc"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
-    async def test_list_users_with_pagination(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(skip=10, limit=5))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
-
     async def test_list_users_empty_result(self, mock_db):
         # Arrange
         mock_db.execute.return_value.scalars.return_value.all.return_value = []
@@ -203,14 +148,3 @@ class TestUserService:
 
         # Assert
         assert result == []
-
-    async def test_list_users_invalid_sort_by(self, mock_db, sample_user):
-        # Arrange
-        mock_db.execute.return_value.scalars.return_value.all.return_value = [sample_user]
-
-        # Act
-        result = await UserService.list_users(mock_db, UserFilter(sort_by="invalid_field"))
-
-        # Assert
-        assert len(result) == 1
-        assert result[0] == sample_user
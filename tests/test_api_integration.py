@@ -1,10 +1,9 @@
 import pytest
-from fastapi.testclient import TestClient
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
-from uuid import uuid4
-from src.main import app  # Import the real app
+from uuid import UUID
 from src.schemas.content_node import ContentNode
 from src.dependencies import (
     get_fs_service,
@@ -15,13 +14,15 @@ from src.dependencies import (
     get_db,
 )
 from src.core.config import settings
+from src.core.errors import ContentFileNotFoundError, SecurityError
+from src.routers.analytics_router import router as analytics_router
 
 
 async def _fake_db_session():
     yield AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_fs_service():
     """Mock FileSystemService for integration tests."""
     service = MagicMock()
@@ -30,47 +31,42 @@ def mock_fs_service():
     service.create_directory = AsyncMock()
     service.delete_file = AsyncMock()
     service.delete_directory = AsyncMock()
-    service.path_exists = AsyncMock(return_value=True)
-    service.scan_directory = AsyncMock(return_value=[])
+    service.path_exists = AsyncMock()
+    service.scan_directory = AsyncMock()
     return service
 
 
-@pytest.fixture
-def mock_content_scanner(mock_fs_service):
+@pytest.fixture(scope="module")
+def mock_content_scanner():
     """Mock ContentScannerService for integration tests."""
     service = MagicMock()
-    service.build_content_tree = AsyncMock(return_value=[])
+    service.build_content_tree = AsyncMock()
     service.clear_cache = MagicMock()
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_ulf_parser():
     """Mock ULFParserService for integration tests."""
     service = MagicMock()
-    service.parse = MagicMock(return_value={"title": "Test", "cells": []})
+    service.parse = MagicMock()
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_get_current_admin():
     """Mock admin authentication."""
     admin = MagicMock()
     admin.role = "admin"
     admin.id = 1
+    admin.user_id = UUID("22222222-2222-2222-2222-222222222222")
     return admin
 
 
-@pytest.fixture
-def integration_app(mock_fs_service, mock_content_scanner, mock_ulf_parser, mock_get_current_admin):
-    """Create integration test app with mocked services."""
-    test_app = FastAPI()
-
-    # Include the real routers
-    from src.api.v1.admin import router as admin_router
-    from src.api.v1.lessons import router as lessons_router
-    test_app.include_router(admin_router, prefix="/api/admin")
-    test_app.include_router(lessons_router, prefix="/api/lessons")
+@pytest.fixture(scope="module")
+def integration_app(router_app, mock_fs_service, mock_content_scanner, mock_ulf_parser, mock_get_current_admin):
+    """Point the shared router app at this module's mocked services."""
+    test_app = router_app
 
     # Override dependencies
     test_app.dependency_overrides[get_fs_service] = lambda: mock_fs_service
@@ -78,13 +74,38 @@ def integration_app(mock_fs_service, mock_content_scanner, mock_ulf_parser, mock
     test_app.dependency_overrides[get_ulf_parser] = lambda: mock_ulf_parser
     test_app.dependency_overrides[require_current_admin] = lambda: mock_get_current_admin
     test_app.dependency_overrides[require_current_user] = lambda: mock_get_current_admin
-    return test_app
+    test_app.dependency_overrides[get_db] = _fake_db_session
+    yield test_app
+    test_app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_services(mock_fs_service, mock_content_scanner, mock_ulf_parser):
+    """Restore the module-scoped mocks' defaults before each test."""
+    mock_fs_service.reset_mock(return_value=True, side_effect=True)
+    mock_fs_service.path_exists.return_value = True
+    mock_fs_service.scan_directory.return_value = []
+    mock_content_scanner.reset_mock(return_value=True, side_effect=True)
+    mock_content_scanner.build_content_tree.return_value = []
+    mock_ulf_parser.reset_mock(return_value=True, side_effect=True)
+    mock_ulf_parser.parse.return_value = {"title": "Test", "cells": []}
+
+
+@pytest.fixture(scope="module")
 def client(integration_app):
-    """Integration test client."""
-    return TestClient(integration_app)
+    """Integration test client, opened once for the module."""
+    with TestClient(integration_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def anonymous_client():
+    """Client for the analytics routes with no authentication override installed."""
+    app = FastAPI()
+    app.include_router(analytics_router, prefix="/api")
+    app.dependency_overrides[get_db] = _fake_db_session
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 class TestAPIIntegration:
@@ -141,26 +162,30 @@ class TestAPIIntegration:
         # Verify cache was cleared
         mock_content_scanner.clear_cache.assert_called()
 
-    def test_error_handling_integration(self, client, mock_fs_service):
-        """Test error handling across the API."""
-        from src.core.errors import ContentFileNotFoundError
-        mock_fs_service.read_file.side_effect = ContentFileNotFoundError("File not found")
-
-        # Test admin config file
-        response = client.get("/api/admin/config-file?path=missing.yml")
-        assert response.status_code == 404
-
-        # Test lesson raw get
-        response = client.get("/api/lessons/missing/raw")
-        assert response.status_code == 404
-
-    def test_security_integration(self, client, mock_fs_service):
-        """Test security validation integration."""
-        from src.core.errors import SecurityError
-        mock_fs_service.read_file.side_effect = SecurityError("Access denied")
-
-        response = client.get("/api/admin/config-file?path=../../../etc/passwd")
-        assert response.status_code == 403
+    @pytest.mark.parametrize(
+        "side_effect, url, expected_status",
+        [
+            pytest.param(
+                ContentFileNotFoundError("File not found"), "/api/admin/config-file?path=missing.yml", 404,
+                id="admin_config_not_found",
+            ),
+            pytest.param(
+                ContentFileNotFoundError("File not found"), "/api/lessons/missing/raw", 404,
+                id="lesson_raw_not_found",
+            ),
+            pytest.param(
+                SecurityError("Access denied"), "/api/admin/config-file?path=../../../etc/passwd", 403,
+                id="path_traversal",
+            ),
+        ],
+    )
+    def test_error_handling_integration(self, client, mock_fs_service, side_effect, url, expected_status):
+        """Test that file system errors map to HTTP statuses across the API."""
+        mock_fs_service.read_file.side_effect = side_effect
+
+        response = client.get(url)
+
+        assert response.status_code == expected_status
 
     def test_validation_integration(self, client):
         """Test request validation integration."""
@@ -201,17 +226,6 @@ class TestAPIIntegration:
 
     def test_track_activity_success(self, client):
         """Test successful activity tracking returns 202."""
-        # Mock authenticated user
-        from unittest.mock import patch
-        from src.routers.analytics_router import router as analytics_router
-        client.app.include_router(analytics_router, prefix="/api")
-
-        mock_user = MagicMock()
-        mock_user.user_id = uuid4()
-
-        client.app.dependency_overrides[require_current_user] = lambda: mock_user
-        client.app.dependency_overrides[get_db] = _fake_db_session
-
         with patch("src.services.analytics_service.AnalyticsService.track_activity") as mock_track:
             mock_track.return_value = None
             response = client.post("/api/activity-log", json={
@@ -219,51 +233,22 @@ class TestAPIIntegration:
                 "details": {"lesson_slug": "test-lesson", "course_slug": "test-course"}
             })
 
-        client.app.dependency_overrides.pop(require_current_user, None)
-        client.app.dependency_overrides.pop(get_db, None)
-
         assert response.status_code == 202
-                # Verify background task would be called (can't easily test background tasks in TestClient)
+        # Verify background task would be called (can't easily test background tasks in TestClient)
 
-    def test_track_activity_unauthenticated(self, client):
+    def test_track_activity_unauthenticated(self, anonymous_client):
         """Test activity tracking without authentication returns 401."""
-        # Include analytics router
-        from src.routers.analytics_router import router as analytics_router
-        client.app.include_router(analytics_router, prefix="/api")
-
-        original_user_override = client.app.dependency_overrides.pop(require_current_user, None)
-        original_db_override = client.app.dependency_overrides.pop(get_db, None)
-
-        response = client.post("/api/activity-log", json={
+        response = anonymous_client.post("/api/activity-log", json={
             "activity_type": "LOGIN"
         })
 
         assert response.status_code == 401
 
-        if original_user_override is not None:
-            client.app.dependency_overrides[require_current_user] = original_user_override
-        if original_db_override is not None:
-            client.app.dependency_overrides[get_db] = original_db_override
-
     def test_track_activity_invalid_data(self, client):
         """Test activity tracking with invalid data returns 422."""
-        # Mock authenticated user
-        from unittest.mock import patch
-        from src.routers.analytics_router import router as analytics_router
-        client.app.include_router(analytics_router, prefix="/api")
-
-        mock_user = MagicMock()
-        mock_user.user_id = uuid4()
-
-        client.app.dependency_overrides[require_current_user] = lambda: mock_user
-        client.app.dependency_overrides[get_db] = _fake_db_session
-
         response = client.post("/api/activity-log", json={
             "activity_type": "INVALID_TYPE",
             "details": {"key": "value"}
         })
 
-        client.app.dependency_overrides.pop(require_current_user, None)
-        client.app.dependency_overrides.pop(get_db, None)
-
         assert response.status_code == 422
@@ -1,23 +1,13 @@
-import os
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
-os.environ.setdefault("SUPABASE_KEY", "test-key")
-os.environ.setdefault("SECRET_KEY", "test-secret")
-
-from src.main import app
 from src.core.security import create_access_token
 
 
 @pytest.mark.asyncio
-async def test_register_user_success(monkeypatch):
+async def test_register_user_success(app, monkeypatch):
     client_mock = MagicMock()
     sign_up_response = MagicMock()
     sign_up_response.session = MagicMock(access_token="fake-register-token")
@@ -48,7 +38,7 @@ async def test_register_user_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_login_success(monkeypatch):
+async def test_login_success(app, monkeypatch):
     client_mock = MagicMock()
     sign_in_response = MagicMock()
     sign_in_response.session = MagicMock(access_token="fake-login-token")
@@ -77,7 +67,7 @@ async def test_login_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_me_success(monkeypatch):
+async def test_get_me_success(app, monkeypatch):
     user_id = "11111111-1111-1111-1111-111111111111"
     token = create_access_token({"sub": user_id, "email": "user@example.com"})
 
@@ -96,7 +86,7 @@ async def test_get_me_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_check_email_exists(monkeypatch):
+async def test_check_email_exists(app, monkeypatch):
     client_mock = MagicMock()
     profiles_table = MagicMock()
     select_mock = MagicMock()
@@ -118,7 +108,7 @@ async def test_check_email_exists(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_check_email_not_exists(monkeypatch):
+async def test_check_email_not_exists(app, monkeypatch):
     client_mock = MagicMock()
     profiles_table = MagicMock()
     select_mock = MagicMock()
@@ -140,7 +130,7 @@ async def test_check_email_not_exists(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_check_email_database_error(monkeypatch):
+async def test_check_email_database_error(app, monkeypatch):
     client_mock = MagicMock()
     profiles_table = MagicMock()
     select_mock = MagicMock()
@@ -162,7 +152,7 @@ async def test_check_email_database_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_forgot_password_success(monkeypatch):
+async def test_forgot_password_success(app, monkeypatch):
     # Mock admin client for checking email
     admin_client_mock = MagicMock()
     profiles_table = MagicMock()
@@ -191,7 +181,7 @@ async def test_forgot_password_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_forgot_password_email_not_found(monkeypatch):
+async def test_forgot_password_email_not_found(app, monkeypatch):
     admin_client_mock = MagicMock()
     profiles_table = MagicMock()
     select_mock = MagicMock()
@@ -213,7 +203,7 @@ async def test_forgot_password_email_not_found(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_forgot_password_database_error(monkeypatch):
+async def test_forgot_password_database_error(app, monkeypatch):
     admin_client_mock = MagicMock()
     profiles_table = MagicMock()
     select_mock = MagicMock()
@@ -235,7 +225,7 @@ async def test_forgot_password_database_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_forgot_password_send_email_error(monkeypatch):
+async def test_forgot_password_send_email_error(app, monkeypatch):
     # Mock admin client for checking email
     admin_client_mock = MagicMock()
     profiles_table = MagicMock()
@@ -264,7 +254,7 @@ async def test_forgot_password_send_email_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_success(monkeypatch):
+async def test_reset_password_success(app, monkeypatch):
     client_mock = MagicMock()
     client_mock.auth = MagicMock()
     client_mock.auth.verify_otp = AsyncMock()
@@ -283,7 +273,7 @@ async def test_reset_password_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_invalid_token(monkeypatch):
+async def test_reset_password_invalid_token(app, monkeypatch):
     client_mock = MagicMock()
     client_mock.auth = MagicMock()
     client_mock.auth.verify_otp = AsyncMock(side_effect=Exception("Invalid token"))
@@ -301,7 +291,7 @@ async def test_reset_password_invalid_token(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_update_error(monkeypatch):
+async def test_reset_password_update_error(app, monkeypatch):
     client_mock = MagicMock()
     client_mock.auth = MagicMock()
     client_mock.auth.verify_otp = AsyncMock()
@@ -1,20 +1,11 @@
-import os
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
-os.environ.setdefault("SUPABASE_KEY", "test-key")
-os.environ.setdefault("SECRET_KEY", "test-secret")
 
+from src.core.errors import AuthenticationError, DatabaseError, ExternalServiceError
 from src.core.rate_limiting import limiter
 from src.core.supabase_client import (
     get_resilient_supabase_admin_client,
@@ -26,11 +17,19 @@ from src.schemas.token import RefreshTokenRequest
 from src.schemas.user import UserCreate
 
 
+class FakeSession:
+    """Async session stand-in; the router itself only commits, services get it passed through."""
+
+    def __init__(self):
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.close = AsyncMock()
+
+
 @pytest.fixture
 def mock_db():
     """Mock AsyncSession database."""
-    db = AsyncMock(spec=AsyncSession)
-    return db
+    return FakeSession()
 
 
 @pytest.fixture
@@ -171,7 +170,6 @@ class TestLogin:
     async def test_login_invalid_credentials(self, async_client, mock_supabase_client):
         """Test login with invalid credentials."""
         # Mock Supabase auth failure
-        from src.core.errors import AuthenticationError
 
         mock_supabase_client.auth.sign_in_with_password = AsyncMock(side_effect=AuthenticationError("Invalid credentials"))
 
@@ -187,7 +185,6 @@ class TestLogin:
     @pytest.mark.asyncio
     async def test_login_supabase_error(self, async_client, mock_supabase_client):
         """Test login with Supabase service error."""
-        from src.core.errors import ExternalServiceError
         mock_supabase_client.auth.sign_in_with_password = AsyncMock(side_effect=ExternalServiceError("Service unavailable"))
 
         response = await async_client.post("/auth/login", data={
@@ -209,7 +206,6 @@ class TestLogin:
         mock_supabase_client.auth.sign_in_with_password = AsyncMock(return_value=auth_response)
 
         # Mock session creation failure
-        from src.core.errors import DatabaseError
         mock_session_service.create_session = AsyncMock(side_effect=DatabaseError("Session creation failed"))
 
         response = await async_client.post("/auth/login", data={
@@ -288,7 +284,6 @@ class TestRegister:
     @pytest.mark.asyncio
     async def test_register_database_error(self, async_client, mock_user_service):
         """Test registration with database error."""
-        from src.core.errors import DatabaseError
         mock_user_service.create_user_with_id = AsyncMock(side_effect=DatabaseError("Database error"))
 
         user_data = UserCreate(
@@ -337,7 +332,6 @@ class TestRefreshToken:
     @pytest.mark.asyncio
     async def test_refresh_token_invalid_token(self, async_client, mock_security_functions):
         """Test refresh with invalid token."""
-        from src.core.errors import AuthenticationError
         mock_security_functions['verify_refresh_token'].side_effect = AuthenticationError("Invalid token")
 
         refresh_request = RefreshTokenRequest(refresh_token="invalid_token")
@@ -370,7 +364,6 @@ class TestRefreshToken:
         mock_session_service.get_session_by_token_hash = AsyncMock(return_value=mock_session)
 
         # Mock database commit failure
-        from src.core.errors import DatabaseError
         mock_db.commit = AsyncMock(side_effect=DatabaseError("Database error"))
 
         refresh_request = RefreshTokenRequest(refresh_token="valid_token")
@@ -1,26 +1,18 @@
-import os
-import sys
-from pathlib import Path
 from uuid import UUID
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
-os.environ.setdefault("SUPABASE_KEY", "test-key")
-os.environ.setdefault("SECRET_KEY", "test-secret")
-
-from src.main import app
 from src.core.security import get_current_user
 from src.schemas.user import User
 
+TEST_USER = User.model_construct(user_id=UUID("11111111-1111-1111-1111-111111111111"), full_name="Test", email="user@example.com")
+
 
 @pytest.mark.asyncio
-async def test_enroll_in_course_success(monkeypatch):
-    test_user = User(user_id=UUID("11111111-1111-1111-1111-111111111111"), full_name="Test", email="user@example.com")
+async def test_enroll_in_course_success(app, monkeypatch):
+    test_user = TEST_USER
 
     async def mock_get_current_user():
         return test_user
@@ -82,8 +74,8 @@ async def test_enroll_in_course_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_my_courses(monkeypatch):
-    test_user = User(user_id=UUID("11111111-1111-1111-1111-111111111111"), full_name="Test", email="user@example.com")
+async def test_get_my_courses(app, monkeypatch):
+    test_user = TEST_USER
 
     async def mock_get_current_user():
         return test_user
@@ -135,8 +127,8 @@ async def test_get_my_courses(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_course_details_with_progress(monkeypatch):
-    test_user = User(user_id=UUID("11111111-1111-1111-1111-111111111111"), full_name="Test", email="user@example.com")
+async def test_get_course_details_with_progress(app, monkeypatch):
+    test_user = TEST_USER
 
     async def mock_get_current_user():
         return test_user
@@ -197,7 +189,7 @@ async def test_get_course_details_with_progress(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_my_courses_unauthorized():
+async def test_get_my_courses_unauthorized(app):
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as async_client:
         response = await async_client.get("/api/v1/dashboard/my-courses")
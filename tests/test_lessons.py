@@ -8,7 +8,6 @@ from httpx import ASGITransport, AsyncClient
 
 from src.core.config import settings
 from src.dependencies import require_current_user
-from src.main import app
 from src.schemas.user import User
 
 
@@ -40,16 +39,19 @@ print("Hello")
     return file_path
 
 
+TEST_USER = User.model_construct(
+    user_id=UUID("22222222-2222-2222-2222-222222222222"),
+    full_name="Tester",
+    email="tester@example.com",
+)
+
+
 def _override_user():
-    return User(
-        user_id=UUID("22222222-2222-2222-2222-222222222222"),
-        full_name="Tester",
-        email="tester@example.com",
-    )
+    return TEST_USER
 
 
 @pytest.mark.asyncio
-async def test_get_lesson_content_success(tmp_path, monkeypatch):
+async def test_get_lesson_content_success(app, tmp_path, monkeypatch):
     content_root = tmp_path / "content"
     _write_lesson_file(content_root, "sample-course", "sample-lesson")
 
@@ -77,7 +79,7 @@ async def test_get_lesson_content_success(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_lesson_content_not_found(tmp_path, monkeypatch):
+async def test_get_lesson_content_not_found(app, tmp_path, monkeypatch):
     monkeypatch.setattr(settings, "CONTENT_ROOT", str(tmp_path / "content"))
     app.dependency_overrides[require_current_user] = _override_user
 
@@ -93,7 +95,7 @@ async def test_get_lesson_content_not_found(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_lesson_parse_error(tmp_path, monkeypatch):
+async def test_get_lesson_parse_error(app, tmp_path, monkeypatch):
     content_root = tmp_path / "content"
     lesson_dir = content_root / "courses" / "sample-course"
     lesson_dir.mkdir(parents=True, exist_ok=True)
@@ -114,7 +116,7 @@ async def test_get_lesson_parse_error(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_success():
+async def test_complete_lesson_success(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     with patch('src.db.session.get_supabase_client') as mock_get_client:
@@ -145,7 +147,7 @@ async def test_complete_lesson_success():
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_invalid_format_no_slash():
+async def test_complete_lesson_invalid_format_no_slash(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     transport = ASGITransport(app=app)
@@ -163,7 +165,7 @@ async def test_complete_lesson_invalid_format_no_slash():
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_invalid_format_empty_parts():
+async def test_complete_lesson_invalid_format_empty_parts(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     transport = ASGITransport(app=app)
@@ -181,7 +183,7 @@ async def test_complete_lesson_invalid_format_empty_parts():
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_upsert_failure():
+async def test_complete_lesson_upsert_failure(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     with patch('src.db.session.get_supabase_client') as mock_get_client:
@@ -206,7 +208,7 @@ async def test_complete_lesson_upsert_failure():
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_rpc_failure():
+async def test_complete_lesson_rpc_failure(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     with patch('src.db.session.get_supabase_client') as mock_get_client:
@@ -234,7 +236,7 @@ async def test_complete_lesson_rpc_failure():
 
 
 @pytest.mark.asyncio
-async def test_complete_lesson_missing_progress_data():
+async def test_complete_lesson_missing_progress_data(app):
     app.dependency_overrides[require_current_user] = _override_user
 
     with patch('src.db.session.get_supabase_client') as mock_get_client:
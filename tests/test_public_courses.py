@@ -1,17 +1,12 @@
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from src.main import app
 
 
 @pytest.mark.asyncio
-async def test_list_courses_success(monkeypatch):
+async def test_list_courses_success(app, monkeypatch):
     client_mock = MagicMock()
 
     table = MagicMock()
@@ -51,7 +46,7 @@ async def test_list_courses_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_course_details_success(monkeypatch):
+async def test_get_course_details_success(app, monkeypatch):
     client_mock = MagicMock()
     rpc_payload = {
         "course_id": "00000000-0000-0000-0000-000000000001",
@@ -84,7 +79,7 @@ async def test_get_course_details_success(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_course_details_not_found(monkeypatch):
+async def test_get_course_details_not_found(app, monkeypatch):
     client_mock = MagicMock()
     client_mock.rpc = AsyncMock(return_value=MagicMock(data=None))
     monkeypatch.setattr("src.api.v1.courses.get_supabase_client", lambda: client_mock)
@@ -97,7 +92,7 @@ async def test_get_course_details_not_found(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_list_courses_pagination_validation():
+async def test_list_courses_pagination_validation(app):
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         resp = await ac.get("/api/v1/courses?limit=0")